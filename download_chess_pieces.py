@@ -1,17 +1,40 @@
 import os
 import requests
 import glob
+import cairosvg
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Matches the piece size used by examples/chess/chess_game.py (SQUARE_SIZE - 10)
+PIECE_SIZE = 65
+
+# requests.Session is not thread-safe, so each download thread gets its own
+_local = threading.local()
+
+def get_session():
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
 
 def download_piece(piece_name, color):
     url = f"https://lichess1.org/assets/piece/cburnett/{color}{piece_name}.svg"
     output_dir = "assets/chess"
     os.makedirs(output_dir, exist_ok=True)
     
-    response = requests.get(url)
+    response = get_session().get(url)
     if response.status_code == 200:
         with open(f"{output_dir}/{color}_{piece_name.lower()}.svg", "wb") as f:
             f.write(response.content)
         print(f"Downloaded {color}_{piece_name.lower()}.svg")
+        # Rasterize at the final on-screen size so the game can skip scaling
+        cairosvg.svg2png(
+            bytestring=response.content,
+            write_to=f"{output_dir}/{color}_{piece_name.lower()}.png",
+            output_width=PIECE_SIZE,
+            output_height=PIECE_SIZE
+        )
+        print(f"Rasterized {color}_{piece_name.lower()}.png")
     else:
         print(f"Failed to download {color}_{piece_name.lower()}.svg")
 
@@ -27,9 +50,9 @@ for f in glob.glob("assets/chess/*.png") + glob.glob("assets/chess/*.svg"):
     except:
         pass
 
-# Download all pieces
-for color in colors:
-    for piece in pieces:
-        download_piece(piece, color)
+# Download all pieces in parallel
+with ThreadPoolExecutor(max_workers=len(pieces) * len(colors)) as executor:
+    list(executor.map(lambda args: download_piece(*args),
+                      [(piece, color) for color in colors for piece in pieces]))
 
 print("Chess pieces downloaded successfully!") 
\ No newline at end of file
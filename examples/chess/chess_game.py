@@ -1,9 +1,10 @@
 import asyncio
+import logging
 import pygame
 import chess
 import argparse
 from typing import List, Tuple, Dict, Any, Optional
-from nexus.network.server import NexusServer
+from nexus.network.server import NexusServer, install_uvloop
 from nexus.network.client import NexusClient
 from nexus.game.game import NexusGame
 from nexus.network.player import NexusPlayer
@@ -15,15 +16,27 @@ from enum import Enum
 import pygame.freetype
 import os
 
-# Initialize Pygame
-pygame.init()
-pygame.freetype.init()
+log = logging.getLogger("chess_game")
 
 # Constants
 WINDOW_SIZE = (800, 800)
 BOARD_SIZE = 600
 SQUARE_SIZE = BOARD_SIZE // 8
 
+# Asset file name codes by piece type and color
+_PIECE_FILE_CODES = {
+    chess.PAWN: 'p',
+    chess.ROOK: 'r',
+    chess.KNIGHT: 'n',
+    chess.BISHOP: 'b',
+    chess.QUEEN: 'q',
+    chess.KING: 'k'
+}
+_COLOR_FILE_CODES = {
+    chess.WHITE: 'w',
+    chess.BLACK: 'b'
+}
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -33,17 +46,36 @@ DARK_SQUARE = (181, 136, 99)  # Brown
 LIGHT_SQUARE = (240, 217, 181)  # Light brown
 HIGHLIGHT = (124, 252, 0)  # Light green for legal moves
 SELECTED = (255, 255, 0, 128)  # Semi-transparent yellow for selected piece
+MOVE_DOT_RADIUS = 8  # Radius of the legal move indicator
+
+def _blend(color, background):
+    """Pre-blend an RGBA color over an opaque background color"""
+    *rgb, alpha = color
+    return tuple((c * alpha + bg * (255 - alpha)) // 255 for c, bg in zip(rgb, background))
+
+# Fonts, loaded by _client_setup so the server never initializes SDL
+FONT = None
+SMALL_FONT = None
 
-# Fonts
-FONT = pygame.freetype.SysFont('Arial', 32)
-SMALL_FONT = pygame.freetype.SysFont('Arial', 24)
+def _client_setup():
+    """Initialize Pygame and load fonts for client mode"""
+    global FONT, SMALL_FONT
+    pygame.init()
+    # Only queue the events the client handles, plus exposes so a dirty screen gets redrawn.
+    # TEXTINPUT and KEYUP stay allowed since pygame derives KEYDOWN.unicode from them
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+                              pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+                              pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
+    pygame.freetype.init()
+    FONT = pygame.freetype.SysFont('Arial', 32)
+    SMALL_FONT = pygame.freetype.SysFont('Arial', 24)
 
 class GameMenu:
     def __init__(self, screen):
         self.screen = screen
-        self.username = ""
-        self.game_name = ""
-        self.password = ""
+        # Character buffers for the text inputs, keyed by input name
+        self._bufs = {"username": [], "game_name": [], "password": []}
         self.state = "username"  # States: username, menu, create, join
         self.active_input = None
         self.error_message = ""
@@ -83,16 +115,71 @@ class GameMenu:
             "password": pygame.Rect(field_x, 300, field_width, 40)
         }
 
+        # Rendered text surfaces keyed by (text, color, font)
+        self._text_cache = {}
+        # Last (text, surface) rendered for each input field
+        self._field_text = {}
+
+        # Whether the menu changed since it was last drawn
+        self._dirty = True
+
+        # Index of the hovered button in the current state, updated on mouse motion
+        self._hover_button = None
+
+    @property
+    def username(self):
+        return "".join(self._bufs["username"])
+
+    @username.setter
+    def username(self, value):
+        self._bufs["username"] = list(value)
+
+    @property
+    def game_name(self):
+        return "".join(self._bufs["game_name"])
+
+    @game_name.setter
+    def game_name(self, value):
+        self._bufs["game_name"] = list(value)
+
+    @property
+    def password(self):
+        return "".join(self._bufs["password"])
+
+    @password.setter
+    def password(self, value):
+        self._bufs["password"] = list(value)
+
     def set_state(self, state):
         self.state = state
         self.error_message = ""
         self.error_timer = 0
+        self._dirty = True
+        self._update_hover(pygame.mouse.get_pos())
     
+    def _update_hover(self, pos):
+        """Recompute the hovered button, marking the menu dirty if it changed"""
+        hover_button = next(
+            (i for i, button in enumerate(self.buttons.get(self.state, []))
+             if button["rect"].collidepoint(pos)),
+            None
+        )
+        if hover_button != self._hover_button:
+            self._hover_button = hover_button
+            self._dirty = True
+
     def show_error(self, message):
         self.error_message = message
         self.error_timer = 180  # Show for 3 seconds at 60 FPS
+        self._dirty = True
     
     def handle_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            self._update_hover(event.pos)
+            return False
+
+        # Any other input may change focus or text
+        self._dirty = True
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Handle button clicks
             for button in self.buttons.get(self.state, []):
@@ -129,19 +216,13 @@ class GameMenu:
                 elif self.state == "join":
                     return self.join_game()
             elif event.key == pygame.K_BACKSPACE:
-                if self.active_input == "username":
-                    self.username = self.username[:-1]
-                elif self.active_input == "game_name":
-                    self.game_name = self.game_name[:-1]
-                elif self.active_input == "password":
-                    self.password = self.password[:-1]
-            elif event.unicode.isprintable():
-                if self.active_input == "username":
-                    self.username += event.unicode
-                elif self.active_input == "game_name":
-                    self.game_name += event.unicode
-                elif self.active_input == "password":
-                    self.password += event.unicode
+                buf = self._bufs.get(self.active_input)
+                if buf:
+                    buf.pop()
+            elif event.unicode and event.unicode.isprintable():
+                buf = self._bufs.get(self.active_input)
+                if buf is not None:
+                    buf.append(event.unicode)
         
         return False
 
@@ -167,19 +248,34 @@ class GameMenu:
     def quick_match(self):
         return ("quick_match", "", "")
 
+    def _text(self, font, text, color):
+        """Render text once and reuse the surface on later frames"""
+        key = (text, color, id(font))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface, _ = font.render(text, color)
+            self._text_cache[key] = surface
+        return surface
+
     def draw_button(self, button, hover=False):
         color = LIGHT_GRAY if hover else GRAY
         pygame.draw.rect(self.screen, color, button["rect"])
         pygame.draw.rect(self.screen, BLACK, button["rect"], 2)
-        text_surface, text_rect = FONT.render(button["text"], BLACK)
-        text_rect.center = button["rect"].center
+        text_surface = self._text(FONT, button["text"], BLACK)
+        text_rect = text_surface.get_rect(center=button["rect"].center)
         self.screen.blit(text_surface, text_rect)
     
-    def draw_input_field(self, rect, text, active):
+    def draw_input_field(self, name, text, active):
+        rect = self.input_fields[name]
         pygame.draw.rect(self.screen, WHITE, rect)
         pygame.draw.rect(self.screen, (0, 0, 255) if active else BLACK, rect, 2)
-        text_surface, text_rect = FONT.render(text, BLACK)
-        text_rect.midleft = (rect.left + 10, rect.centery)
+        # Typed text changes with every keystroke, so keep only the latest render per field
+        cached = self._field_text.get(name)
+        if cached is None or cached[0] != text:
+            cached = (text, FONT.render(text, BLACK)[0])
+            self._field_text[name] = cached
+        text_surface = cached[1]
+        text_rect = text_surface.get_rect(midleft=(rect.left + 10, rect.centery))
         self.screen.blit(text_surface, text_rect)
     
     def draw(self):
@@ -187,84 +283,113 @@ class GameMenu:
         
         # Draw error message if any
         if self.error_message and self.error_timer > 0:
-            text_surface, text_rect = SMALL_FONT.render(self.error_message, (255, 0, 0))
+            text_surface = self._text(SMALL_FONT, self.error_message, (255, 0, 0))
+            text_rect = text_surface.get_rect()
             text_rect.centerx = WINDOW_SIZE[0] // 2
             text_rect.bottom = WINDOW_SIZE[1] - 20
             self.screen.blit(text_surface, text_rect)
             self.error_timer -= 1
         
         if self.state == "username":
-            title_surface, title_rect = FONT.render("Enter Your Username", BLACK)
+            title_surface = self._text(FONT, "Enter Your Username", BLACK)
+            title_rect = title_surface.get_rect()
             title_rect.centerx = WINDOW_SIZE[0] // 2
             title_rect.top = 150
             self.screen.blit(title_surface, title_rect)
             
             self.draw_input_field(
-                self.input_fields["username"],
+                "username",
                 self.username,
                 self.active_input == "username"
             )
         
         elif self.state in ["create", "join"]:
             title = "Create Game" if self.state == "create" else "Join Game"
-            title_surface, title_rect = FONT.render(title, BLACK)
+            title_surface = self._text(FONT, title, BLACK)
+            title_rect = title_surface.get_rect()
             title_rect.centerx = WINDOW_SIZE[0] // 2
             title_rect.top = 100
             self.screen.blit(title_surface, title_rect)
             
-            name_label, _ = SMALL_FONT.render("Game Name:", BLACK)
+            name_label = self._text(SMALL_FONT, "Game Name:", BLACK)
             self.screen.blit(name_label, (250, 170))
             
-            pass_label, _ = SMALL_FONT.render("Password (optional):", BLACK)
+            pass_label = self._text(SMALL_FONT, "Password (optional):", BLACK)
             self.screen.blit(pass_label, (250, 270))
             
             self.draw_input_field(
-                self.input_fields["game_name"],
+                "game_name",
                 self.game_name,
                 self.active_input == "game_name"
             )
             
             self.draw_input_field(
-                self.input_fields["password"],
+                "password",
                 "*" * len(self.password),
                 self.active_input == "password"
             )
         
         # Draw buttons for current state
-        for button in self.buttons.get(self.state, []):
-            hover = button["rect"].collidepoint(pygame.mouse.get_pos())
-            self.draw_button(button, hover)
+        for i, button in enumerate(self.buttons.get(self.state, [])):
+            self.draw_button(button, i == self._hover_button)
+
+        # Keep redrawing while the error message counts down
+        self._dirty = self.error_timer > 0
 
 @dataclass
 class ChessGameState(GameState):
     """Game state for Chess that works for both client and server"""
-    board: chess.Board = field(default_factory=chess.Board)
-    current_player: str = 'white'  # white always goes first
-    my_color: Optional[str] = None  # Used by client to track their color
+    board: chess.Board = field(default_factory=chess.Board)  # board.turn is True when white is to move
+    my_is_white: Optional[bool] = None  # Used by client to track their color
     is_your_turn: bool = False
     selected_square: Optional[int] = None  # Currently selected square (0-63)
     legal_moves: List[int] = field(default_factory=list)  # Legal moves for selected piece
+    # Destination squares keyed by origin square, rebuilt lazily per position
+    _legal_by_from: Optional[Dict[int, List[int]]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def current_player(self) -> Optional[str]:
+        """Color to move, or None once the game is over"""
+        if self.game_over:
+            return None
+        return "white" if self.board.turn else "black"
+
+    @property
+    def my_color(self) -> Optional[str]:
+        """Color of the client's player, or None if not assigned yet"""
+        if self.my_is_white is None:
+            return None
+        return "white" if self.my_is_white else "black"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], *args, **kwargs) -> "ChessGameState":
+        """Create a state from a dictionary, also reading a perspective's FEN board and my_color"""
+        state = super().from_dict(data, *args, **kwargs)
+        if isinstance(state.board, str):
+            state.board = chess.Board(state.board)
+        my_color = data.get("my_color")
+        if my_color is not None and "my_is_white" not in data:
+            state.my_is_white = my_color == "white"
+        return state
 
     def get_player_perspective(self, player_index: int) -> Dict[str, Any]:
-        """Get the game state from a specific player's perspective"""
-        state = super().get_player_perspective(player_index)
-        player_color = "white" if player_index == 0 else "black"
-        state.update({
+        """Get the full game state from a specific player's perspective"""
+        is_white = player_index == 0
+        # One literal including the base class fields, instead of updating its dict
+        return {
+            "game_over": self.game_over,
+            "winner": self.winner,
+            "phase": self.phase,
             "board": self.board.fen(),
             "current_player": self.current_player,
-            "winner": self.winner,
-            "my_color": player_color,
-            "is_your_turn": (self.current_player == player_color)
-        })
-        return state
+            "my_color": "white" if is_white else "black",
+            "is_your_turn": not self.game_over and self.board.turn == is_white
+        }
 
     def is_valid(self, cmd: Command, player_index: int) -> Tuple[bool, str]:
         """Validate if a move is valid"""
-        # Get player's color
-        player_color = "white" if player_index == 0 else "black"
-        
         # Verify it's the player's turn
-        if player_color != self.current_player:
+        if self.game_over or self.board.turn != (player_index == 0):
             return False, f"Not your turn - it's {self.current_player}'s turn"
 
         # Validate move
@@ -274,51 +399,69 @@ class ChessGameState(GameState):
             return False, "Invalid command: missing or invalid move"
 
         # Check if move is legal
-        if move not in self.board.legal_moves:
+        if not self.board.is_legal(move):
             return False, "Illegal move"
 
         return True, ""
 
+    def get_update_data(self, cmd: Command) -> Dict[str, Any]:
+        """Only the UCI move is sent, clients derive the rest of the state"""
+        return {"move": cmd.data["move"]}
+
+    def legal_targets(self, from_square: int) -> List[int]:
+        """Get the destination squares of all legal moves from a square"""
+        if self._legal_by_from is None:
+            self._legal_by_from = {}
+            for move in self.board.legal_moves:
+                self._legal_by_from.setdefault(move.from_square, []).append(move.to_square)
+        return self._legal_by_from.get(from_square, [])
+
     def apply(self, update: Update) -> None:
         """Apply an update to the game state"""
         if update.update_type == UpdateType.GAME_STARTED:
             # Initialize game state from server data
             data = update.data
+            # The side to move is part of the FEN, so current_player is not read
             self.board = chess.Board(data.get("board", chess.STARTING_FEN))
-            self.current_player = data.get("current_player", "white")
-            self.my_color = data.get("my_color")
+            my_color = data.get("my_color")
+            self.my_is_white = None if my_color is None else my_color == "white"
             self.is_your_turn = data.get("is_your_turn", False)
             self.game_over = data.get("game_over", False)
             self.winner = data.get("winner")
             self.phase = GamePhase(data.get("phase", "in_game"))
+            self._legal_by_from = None
         elif update.update_type == UpdateType.GAME_STATE_UPDATE:
             if "move" in update.data:
                 # Apply the move
                 move = chess.Move.from_uci(update.data["move"])
                 self.board.push(move)
+                self._legal_by_from = None
                 
                 # Update turn information
-                self.current_player = "black" if self.current_player == "white" else "white"
-                self.is_your_turn = (self.current_player == self.my_color)
+                self.is_your_turn = (self.board.turn == self.my_is_white)
                 
                 # Check for game end conditions
                 if self.board.is_checkmate():
                     self.game_over = True
-                    self.winner = "black" if self.current_player == "white" else "white"
+                    # The side to move is mated
+                    self.winner = "black" if self.board.turn else "white"
                     self.phase = GamePhase.END_GAME
-                    self.current_player = None
                     self.is_your_turn = False
                 elif self.board.is_stalemate() or self.board.is_insufficient_material():
                     self.game_over = True
                     self.winner = None  # Draw
                     self.phase = GamePhase.END_GAME
-                    self.current_player = None
                     self.is_your_turn = False
 
 class ChessGame(NexusGame[ChessGameState]):
     def __init__(self):
-        print("[Client] Initializing Chess game")
-        self.screen = pygame.display.set_mode(WINDOW_SIZE)
+        log.debug("Initializing Chess game")
+        # SCALED uses the SDL2 renderer so blits are composed on the GPU
+        try:
+            self.screen = pygame.display.set_mode(WINDOW_SIZE, pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            # Not every video driver supports vsync
+            self.screen = pygame.display.set_mode(WINDOW_SIZE, pygame.SCALED | pygame.DOUBLEBUF)
         pygame.display.set_caption("Chess")
         self.menu = GameMenu(self.screen)
         self.client = None
@@ -326,33 +469,29 @@ class ChessGame(NexusGame[ChessGameState]):
         self.host = "localhost"  # Default host
         self.port = 8765  # Default port
         
-        # Load piece images
-        self.pieces = {}
+        # Load piece images, indexed by (0 for white, 8 for black) + piece type
+        self._piece_arr: List[Optional[pygame.Surface]] = [None] * 16
         piece_size = SQUARE_SIZE - 10  # Slightly smaller than square size
-        piece_map = {
-            'pawn': 'p',
-            'rook': 'r',
-            'knight': 'n',
-            'bishop': 'b',
-            'queen': 'q',
-            'king': 'k'
-        }
-        color_map = {
-            'white': 'w',
-            'black': 'b'
-        }
-        for color in ['white', 'black']:
-            for piece in ['pawn', 'rook', 'knight', 'bishop', 'queen', 'king']:
-                image_path = os.path.join('assets', 'chess', f"{color_map[color]}_{piece_map[piece]}.svg")
+        for color, color_code in _COLOR_FILE_CODES.items():
+            for piece_type, piece_code in _PIECE_FILE_CODES.items():
+                index = (0 if color else 8) + piece_type
+                base_path = os.path.join('assets', 'chess', f"{color_code}_{piece_code}")
+                image_path = base_path + ".png"
                 try:
-                    image = pygame.image.load(image_path)
-                    self.pieces[f"{color}_{piece}"] = pygame.transform.scale(image, (piece_size, piece_size))
+                    if os.path.exists(image_path):
+                        # Pre-scaled PNG from download_chess_pieces.py
+                        image = pygame.image.load(image_path)
+                    else:
+                        image_path = base_path + ".svg"
+                        image = pygame.transform.scale(pygame.image.load(image_path), (piece_size, piece_size))
+                    # Match the display format so blits take the fast path
+                    self._piece_arr[index] = image.convert_alpha(self.screen)
                 except pygame.error:
-                    print(f"Could not load piece image: {image_path}")
+                    log.warning("Could not load piece image: %s", image_path)
                     # Create a fallback piece representation
                     surface = pygame.Surface((piece_size, piece_size), pygame.SRCALPHA)
                     pygame.draw.circle(surface, (255, 0, 0, 128), (piece_size//2, piece_size//2), piece_size//2)
-                    self.pieces[f"{color}_{piece}"] = surface
+                    self._piece_arr[index] = surface.convert_alpha(self.screen)
 
         # Back to menu button
         button_width = 200
@@ -365,9 +504,41 @@ class ChessGame(NexusGame[ChessGameState]):
             "hover": False
         }
 
+        # Rendered text surfaces keyed by (text, color, font)
+        self._text_cache = {}
+
+        # Whether the screen needs to be redrawn
+        self._dirty = True
+
+        # Pre-render the checkerboard, it never changes between frames
+        self._board_surface = pygame.Surface((BOARD_SIZE, BOARD_SIZE))
+        for rank in range(8):
+            for file in range(8):
+                color = LIGHT_SQUARE if (rank + file) % 2 == 0 else DARK_SQUARE
+                pygame.draw.rect(self._board_surface, color,
+                                 (file * SQUARE_SIZE, rank * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+        self._board_surface = self._board_surface.convert(self.screen)
+
+        # Selection color pre-blended over light and dark squares
+        self._selected_colors = (_blend(SELECTED, LIGHT_SQUARE), _blend(SELECTED, DARK_SQUARE))
+
+        # Screen position of every square from each side's perspective
+        board_x = (WINDOW_SIZE[0] - BOARD_SIZE) // 2
+        board_y = (WINDOW_SIZE[1] - BOARD_SIZE) // 2
+        self._square_xy_white = tuple(
+            (board_x + (square % 8) * SQUARE_SIZE, board_y + (7 - square // 8) * SQUARE_SIZE)
+            for square in range(64)
+        )
+        self._square_xy_black = tuple(
+            (board_x + (7 - square % 8) * SQUARE_SIZE, board_y + (square // 8) * SQUARE_SIZE)
+            for square in range(64)
+        )
+        # 0 for light squares, 1 for dark squares (a1 is dark)
+        self._square_shades = tuple((7 - square // 8 + square % 8) % 2 for square in range(64))
+
         # Game state
         self.game_state = None
-        print("[Client] Game window initialized")
+        log.debug("Game window initialized")
 
     def get_square_at_pos(self, pos: Tuple[int, int]) -> Optional[int]:
         """Convert screen position to board square index (0-63)"""
@@ -381,7 +552,7 @@ class ChessGame(NexusGame[ChessGameState]):
         file = (pos[0] - board_x) // SQUARE_SIZE
         rank = 7 - (pos[1] - board_y) // SQUARE_SIZE  # Flip rank for white's perspective
         
-        if self.game_state and self.game_state.my_color == "black":
+        if self.game_state and self.game_state.my_is_white is False:
             file = 7 - file
             rank = 7 - rank
         
@@ -405,22 +576,17 @@ class ChessGame(NexusGame[ChessGameState]):
         if self.game_state.selected_square is None:
             # Select piece if it's ours
             piece = self.get_piece_at_square(clicked_square)
-            if piece and piece.color == (self.game_state.my_color == "white"):
+            if piece and piece.color == self.game_state.my_is_white:
                 self.game_state.selected_square = clicked_square
                 # Calculate legal moves for this piece
-                self.game_state.legal_moves = [
-                    move.to_square
-                    for move in self.game_state.board.legal_moves
-                    if move.from_square == clicked_square
-                ]
+                self.game_state.legal_moves = self.game_state.legal_targets(clicked_square)
         else:
             # Try to make a move
             if clicked_square in self.game_state.legal_moves:
                 move = chess.Move(self.game_state.selected_square, clicked_square)
                 # Add promotion if needed
                 if self.game_state.board.piece_at(self.game_state.selected_square).piece_type == chess.PAWN:
-                    if (self.game_state.my_color == "white" and clicked_square // 8 == 7) or \
-                       (self.game_state.my_color == "black" and clicked_square // 8 == 0):
+                    if clicked_square // 8 == (7 if self.game_state.my_is_white else 0):
                         move.promotion = chess.QUEEN  # Always promote to queen for simplicity
                 
                 # Send move command
@@ -438,51 +604,50 @@ class ChessGame(NexusGame[ChessGameState]):
         board_y = (WINDOW_SIZE[1] - BOARD_SIZE) // 2
         
         # Draw squares
-        for rank in range(8):
-            for file in range(8):
-                x = board_x + file * SQUARE_SIZE
-                y = board_y + rank * SQUARE_SIZE
-                color = LIGHT_SQUARE if (rank + file) % 2 == 0 else DARK_SQUARE
-                pygame.draw.rect(self.screen, color, (x, y, SQUARE_SIZE, SQUARE_SIZE))
-                
-                # Get board coordinates based on perspective
-                board_file = file
-                board_rank = 7 - rank
-                if self.game_state and self.game_state.my_color == "black":
-                    board_file = 7 - file
-                    board_rank = rank
-                
-                square = board_rank * 8 + board_file
-                
-                # Draw selection highlight
-                if self.game_state and square == self.game_state.selected_square:
-                    highlight = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-                    pygame.draw.rect(highlight, SELECTED, highlight.get_rect())
-                    self.screen.blit(highlight, (x, y))
-                
-                # Draw move highlights
-                if self.game_state and square in self.game_state.legal_moves:
-                    highlight = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-                    pygame.draw.rect(highlight, HIGHLIGHT, highlight.get_rect())
-                    self.screen.blit(highlight, (x, y))
-                
-                # Draw piece
-                if self.game_state:
-                    piece = self.game_state.board.piece_at(square)
-                    if piece:
-                        color = "white" if piece.color else "black"
-                        piece_name = {
-                            chess.PAWN: "pawn",
-                            chess.ROOK: "rook",
-                            chess.KNIGHT: "knight",
-                            chess.BISHOP: "bishop",
-                            chess.QUEEN: "queen",
-                            chess.KING: "king"
-                        }[piece.piece_type]
-                        piece_image = self.pieces[f"{color}_{piece_name}"]
-                        piece_x = x + (SQUARE_SIZE - piece_image.get_width()) // 2
-                        piece_y = y + (SQUARE_SIZE - piece_image.get_height()) // 2
-                        self.screen.blit(piece_image, (piece_x, piece_y))
+        self.screen.blit(self._board_surface, (board_x, board_y))
+        if not self.game_state:
+            return
+
+        # Get screen coordinates based on perspective
+        if self.game_state.my_is_white is False:
+            square_xy = self._square_xy_black
+        else:
+            square_xy = self._square_xy_white
+
+        # Draw selection highlight
+        selected = self.game_state.selected_square
+        if selected is not None:
+            x, y = square_xy[selected]
+            self.screen.fill(self._selected_colors[self._square_shades[selected]],
+                             (x, y, SQUARE_SIZE, SQUARE_SIZE))
+
+        # Draw pieces, visiting only the occupied squares of the bitboard
+        board = self.game_state.board
+        occupied = board.occupied
+        while occupied:
+            square = (occupied & -occupied).bit_length() - 1
+            occupied &= occupied - 1
+            piece = board.piece_at(square)
+            x, y = square_xy[square]
+            piece_image = self._piece_arr[(0 if piece.color else 8) + piece.piece_type]
+            piece_x = x + (SQUARE_SIZE - piece_image.get_width()) // 2
+            piece_y = y + (SQUARE_SIZE - piece_image.get_height()) // 2
+            self.screen.blit(piece_image, (piece_x, piece_y))
+
+        # Draw move highlights on top so captures stay visible
+        for square in self.game_state.legal_moves:
+            x, y = square_xy[square]
+            pygame.draw.circle(self.screen, HIGHLIGHT,
+                               (x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2), MOVE_DOT_RADIUS)
+
+    def _text(self, font, text, color):
+        """Render text once and reuse the surface on later frames"""
+        key = (text, color, id(font))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface, _ = font.render(text, color)
+            self._text_cache[key] = surface
+        return surface
 
     def draw(self):
         self.screen.fill(WHITE)
@@ -490,12 +655,12 @@ class ChessGame(NexusGame[ChessGameState]):
         if self.state == "menu":
             self.menu.draw()
         elif self.state == "connecting":
-            text_surface, text_rect = FONT.render("Connecting...", BLACK)
-            text_rect.center = (self.screen.get_width() // 2, self.screen.get_height() // 2)
+            text_surface = self._text(FONT, "Connecting...", BLACK)
+            text_rect = text_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
             self.screen.blit(text_surface, text_rect)
         elif self.state == "waiting":
-            text_surface, text_rect = FONT.render("Waiting for opponent...", BLACK)
-            text_rect.center = (self.screen.get_width() // 2, self.screen.get_height() // 2)
+            text_surface = self._text(FONT, "Waiting for opponent...", BLACK)
+            text_rect = text_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
             self.screen.blit(text_surface, text_rect)
         elif self.state == "playing" and self.game_state:
             self.draw_board()
@@ -512,8 +677,8 @@ class ChessGame(NexusGame[ChessGameState]):
                 button_color = LIGHT_GRAY if self.back_button["hover"] else GRAY
                 pygame.draw.rect(self.screen, button_color, self.back_button["rect"])
                 pygame.draw.rect(self.screen, BLACK, self.back_button["rect"], 2)
-                text_surface, text_rect = FONT.render(self.back_button["text"], BLACK)
-                text_rect.center = self.back_button["rect"].center
+                text_surface = self._text(FONT, self.back_button["text"], BLACK)
+                text_rect = text_surface.get_rect(center=self.back_button["rect"].center)
                 self.screen.blit(text_surface, text_rect)
             else:
                 if self.game_state.is_your_turn:
@@ -521,25 +686,32 @@ class ChessGame(NexusGame[ChessGameState]):
                 else:
                     status_text = "Opponent's turn!"
             
-            text_surface, text_rect = FONT.render(status_text, BLACK)
+            text_surface = self._text(FONT, status_text, BLACK)
+            text_rect = text_surface.get_rect()
             text_rect.centerx = self.screen.get_width() // 2
             text_rect.bottom = self.back_button["rect"].top - 20 if self.game_state.game_over else self.screen.get_height() - 20
             self.screen.blit(text_surface, text_rect)
         
         pygame.display.flip()
 
-    def run(self):
+    async def run(self):
         """Main game loop"""
-        clock = pygame.time.Clock()
+        frame_time = 1 / 60
+        receive_task = None
         
         while True:
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
+                    if receive_task:
+                        receive_task.cancel()
                     if self.client:
                         self.client.close()
                     pygame.quit()
                     return
+
+                if event.type != pygame.MOUSEMOTION:
+                    self._dirty = True
                 
                 if self.state == "menu":
                     action = self.menu.handle_event(event)
@@ -550,24 +722,31 @@ class ChessGame(NexusGame[ChessGameState]):
                         # Initialize client if not done yet
                         if not self.client:
                             self.client = NexusClient(self.host, self.port)
-                            self.client.connect()
+                            try:
+                                self.client.connect()
+                            except ConnectionError as e:
+                                log.warning("Could not connect: %s", e)
+                                self.client = None
+                                self.menu.show_error("Could not connect to server")
+                                self.state = "menu"
+                                continue
                         
                         if action_type == "create":
-                            print(f"Creating game: {game_name}")
+                            log.info("Creating game: %s", game_name)
                             self.client.send(Command(CommandType.CREATE_GAME, {
                                 "game_name": game_name,
                                 "password": password,
                                 "player_name": self.menu.username
                             }))
                         elif action_type == "join":
-                            print(f"Joining game: {game_name}")
+                            log.info("Joining game: %s", game_name)
                             self.client.send(Command(CommandType.JOIN_GAME, {
                                 "game_name": game_name,
                                 "password": password,
                                 "player_name": self.menu.username
                             }))
                         else:  # quick_match
-                            print("Finding game via matchmaking")
+                            log.info("Finding game via matchmaking")
                             self.client.send(Command(CommandType.FIND_GAME, {
                                 "player_name": self.menu.username
                             }))
@@ -580,6 +759,9 @@ class ChessGame(NexusGame[ChessGameState]):
                             if self.back_button["rect"].collidepoint(mouse_pos):
                                 self.state = "menu"
                                 self.game_state = None
+                                if receive_task:
+                                    receive_task.cancel()
+                                    receive_task = None
                                 if self.client:
                                     self.client.close()
                                     self.client = None
@@ -592,28 +774,51 @@ class ChessGame(NexusGame[ChessGameState]):
                             self.handle_click(mouse_pos)
                     elif event.type == pygame.MOUSEMOTION and self.game_state and self.game_state.game_over:
                         # Handle button hover
-                        self.back_button["hover"] = self.back_button["rect"].collidepoint(event.pos)
+                        hover = self.back_button["rect"].collidepoint(event.pos)
+                        if hover != self.back_button["hover"]:
+                            self.back_button["hover"] = hover
+                            self._dirty = True
             
-            # Process game updates
+            # Wait for game updates until the next frame is due
             if self.client and self.state in ["waiting", "playing"]:
-                update = self.client.receive()
-                if update:
-                    if update.update_type == UpdateType.GAME_STARTED:
-                        print("Game started!")
-                        self.game_state = ChessGameState()
-                        self.game_state.apply(update)
-                        self.state = "playing"
-                    elif update.update_type == UpdateType.GAME_STATE_UPDATE:
-                        if not self.game_state:
-                            self.game_state = ChessGameState()
-                        self.game_state.apply(update)
-                    elif update.update_type == UpdateType.ERROR:
-                        print(f"Error: {update.data.get('message')}")
-                        self.menu.show_error(update.data.get("message", "Unknown error"))
-                        self.state = "menu"
+                if receive_task is None:
+                    receive_task = asyncio.ensure_future(self.client.receive_async())
+                done, _ = await asyncio.wait({receive_task}, timeout=frame_time)
+                if receive_task in done:
+                    update = receive_task.result()
+                    receive_task = None
+                    self.handle_update(update)
+                    # Apply everything else that queued up since the last frame
+                    # before drawing, so a slow frame doesn't lag behind the server
+                    queue = self.client.message_queue
+                    while queue and self.state != "menu":
+                        update = self.client.receive()
+                        if update:
+                            self.handle_update(update)
+                    self._dirty = True
+            else:
+                await asyncio.sleep(frame_time)
             
-            self.draw()
-            clock.tick(60)
+            # Only redraw when something visible changed
+            if self._dirty or (self.state == "menu" and self.menu._dirty):
+                self.draw()
+                self._dirty = False
+
+    def handle_update(self, update: Update):
+        """Handle an update received from the server"""
+        if update.update_type == UpdateType.GAME_STARTED:
+            log.info("Game started!")
+            self.game_state = ChessGameState()
+            self.game_state.apply(update)
+            self.state = "playing"
+        elif update.update_type == UpdateType.GAME_STATE_UPDATE:
+            if not self.game_state:
+                self.game_state = ChessGameState()
+            self.game_state.apply(update)
+        elif update.update_type == UpdateType.ERROR:
+            log.warning("Error: %s", update.data.get('message'))
+            self.menu.show_error(update.data.get("message", "Unknown error"))
+            self.state = "menu"
 
 class ChessServer(NexusServer):
     def create_initial_game_state(self, players: List[NexusPlayer]) -> ChessGameState:
@@ -625,21 +830,27 @@ def main():
     parser.add_argument('mode', choices=['server', 'client'], help='Run in server or client mode')
     parser.add_argument('--host', default='localhost', help='Server host (client mode only)')
     parser.add_argument('--port', type=int, default=8765, help='Server port')
+    parser.add_argument('--verbose', action='store_true', help='Log every message and state change')
     
     args = parser.parse_args()
+    # Lifecycle messages from the framework are logged at INFO, per-message
+    # tracing only with --verbose so it is never formatted otherwise
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="[%(name)s] %(message)s")
     
     if args.mode == 'server':
         run_server(args)
     else:
         # Create and run the game directly
+        _client_setup()
         game = ChessGame()
         game.host = args.host
         game.port = args.port
-        game.run()
+        asyncio.run(game.run())
 
 def run_server(args):
     """Run the game in server mode"""
-    print(f"[Server] Starting server on port {args.port}")
+    install_uvloop()
+    log.info("Starting server on port %s", args.port)
     server = ChessServer()
     asyncio.run(server.start())
 
@@ -0,0 +1,26 @@
+"""Bitboard helpers for Tic-tac-toe"""
+
+# Bitboard masks of the three rows, three columns and two diagonals
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+)
+
+# Bitboard with all nine cells set
+FULL_BOARD = 0x1FF
+
+# Whether each of the 512 possible single-symbol bitboards contains a winning line
+HAS_LINE = bytes(any(bb & mask == mask for mask in WIN_MASKS) for bb in range(512))
+
+def check_winner_bb(x_bb: int, o_bb: int) -> int:
+    """1 if X has a line, 2 if O has a line, otherwise 0"""
+    if HAS_LINE[x_bb]:
+        return 1
+    if HAS_LINE[o_bb]:
+        return 2
+    return 0
+
+def legal_mask(x_bb: int, o_bb: int) -> int:
+    """Bitboard of the empty cells"""
+    return FULL_BOARD & ~(x_bb | o_bb)
@@ -1,8 +1,10 @@
 import asyncio
+import functools
+import logging
 import pygame
 import argparse
 from typing import List, Tuple, Dict, Any, Optional
-from nexus.network.server import NexusServer
+from nexus.network.server import NexusServer, install_uvloop
 from nexus.network.client import NexusClient
 from nexus.game.game import NexusGame
 from nexus.network.player import NexusPlayer
@@ -12,10 +14,9 @@ from nexus.network.command import Command, CommandType
 from dataclasses import dataclass, field
 from enum import Enum
 import pygame.freetype
+from _kernels import check_winner_bb, legal_mask
 
-# Initialize Pygame
-pygame.init()
-pygame.freetype.init()
+log = logging.getLogger("tictactoe")
 
 # Constants
 WINDOW_SIZE = (800, 600)
@@ -25,6 +26,32 @@ GRID_WIDTH = CELL_SIZE * GRID_SIZE
 GRID_HEIGHT = CELL_SIZE * GRID_SIZE
 GRID_MARGIN = 50
 
+# Event types used in the game loop, bound once instead of looked up on pygame per event
+QUIT = pygame.QUIT
+MOUSEMOTION = pygame.MOUSEMOTION
+MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+NOEVENT = pygame.NOEVENT
+
+# Longest time to sleep waiting for input or server updates, one 60 FPS frame
+IDLE_WAIT_MS = 16
+
+# Cell and player symbols
+EMPTY, X, O = 0, 1, 2
+PLAYER_SYMBOLS = (X, O)
+SYMBOL_NAMES = {EMPTY: '', X: 'X', O: 'O'}  # Display names
+
+def _player_symbol(player_index: int) -> int:
+    """Symbol of a player, the first player is X and anyone else O"""
+    return X if player_index == 0 else O
+
+@functools.lru_cache(maxsize=None)
+def _board_rows(x_bb: int, o_bb: int) -> Tuple[Tuple[int, ...], ...]:
+    """Immutable rows of X, O or EMPTY for a pair of bitboards, shared by all states"""
+    return tuple(
+        tuple(X if x_bb >> i & 1 else O if o_bb >> i & 1 else EMPTY for i in range(row * 3, row * 3 + 3))
+        for row in range(3)
+    )
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -33,9 +60,25 @@ LIGHT_GRAY = (200, 200, 200)
 BLUE = (0, 0, 255)
 RED = (255, 0, 0)
 
-# Fonts
-FONT = pygame.freetype.SysFont('Arial', 32)
-SMALL_FONT = pygame.freetype.SysFont('Arial', 24)
+# One Arial face shared by all text, rendered at these sizes
+FONT_SIZE = 32
+SMALL_FONT_SIZE = 24
+
+# Font face, loaded by _client_setup so the server never initializes SDL
+ARIAL = None
+
+def _client_setup():
+    """Initialize Pygame and load fonts for client mode"""
+    global ARIAL
+    pygame.init()
+    # Only queue the events the client handles, plus exposes so a dirty screen gets redrawn.
+    # TEXTINPUT and KEYUP stay allowed since pygame derives KEYDOWN.unicode from them
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+                              pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+                              pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
+    pygame.freetype.init()
+    ARIAL = pygame.freetype.SysFont('Arial', FONT_SIZE)
 
 class GameMenu:
     def __init__(self, screen):
@@ -56,17 +99,17 @@ class GameMenu:
         # Create buttons
         self.buttons = {
             "menu": [
-                {"text": "Create Game", "rect": pygame.Rect(button_x, 200, button_width, 50), "action": lambda: self.set_state("create")},
-                {"text": "Join Game", "rect": pygame.Rect(button_x, 300, button_width, 50), "action": lambda: self.set_state("join")},
+                {"text": "Create Game", "rect": pygame.Rect(button_x, 200, button_width, 50), "action": self.set_state, "arg": "create"},
+                {"text": "Join Game", "rect": pygame.Rect(button_x, 300, button_width, 50), "action": self.set_state, "arg": "join"},
                 {"text": "Quick Match", "rect": pygame.Rect(button_x, 400, button_width, 50), "action": self.quick_match}
             ],
             "create": [
                 {"text": "Create", "rect": pygame.Rect(button_x, 400, button_width, 50), "action": self.create_game},
-                {"text": "Back", "rect": pygame.Rect(50, 500, 100, 40), "action": lambda: self.set_state("menu")}
+                {"text": "Back", "rect": pygame.Rect(50, 500, 100, 40), "action": self.set_state, "arg": "menu"}
             ],
             "join": [
                 {"text": "Join", "rect": pygame.Rect(button_x, 400, button_width, 50), "action": self.join_game},
-                {"text": "Back", "rect": pygame.Rect(50, 500, 100, 40), "action": lambda: self.set_state("menu")}
+                {"text": "Back", "rect": pygame.Rect(50, 500, 100, 40), "action": self.set_state, "arg": "menu"}
             ],
             "username": [
                 {"text": "Start", "rect": pygame.Rect(button_x, 400, button_width, 50), "action": self.submit_username}
@@ -81,24 +124,49 @@ class GameMenu:
             "game_name": pygame.Rect(field_x, 200, field_width, 40),
             "password": pygame.Rect(field_x, 300, field_width, 40)
         }
+
+        # Rendered text surfaces keyed by (text, color, size)
+        self._text_cache = {}
+        # Last (text, surface) rendered for each input field
+        self._field_text = {}
+
+        # Button rects per state, for hit testing them all in one collidelist call
+        self._button_rects = {
+            state: [button["rect"] for button in buttons]
+            for state, buttons in self.buttons.items()
+        }
+
+        # Every button rendered once in its idle and hover colors
+        for buttons in self.buttons.values():
+            for button in buttons:
+                button["surf_idle"] = self._render_button(button, GRAY)
+                button["surf_hover"] = self._render_button(button, LIGHT_GRAY)
+
+        # Whether the menu changed since it was last drawn
+        self._dirty = True
     
     def set_state(self, state):
         self.state = state
         self.error_message = ""
         self.error_timer = 0
+        self._dirty = True
     
     def show_error(self, message):
         self.error_message = message
         self.error_timer = 180  # Show for 3 seconds at 60 FPS
+        self._dirty = True
     
     def handle_event(self, event):
+        # Any input may change hover, focus or text
+        self._dirty = True
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Handle button clicks
-            for button in self.buttons.get(self.state, []):
-                if button["rect"].collidepoint(event.pos):
-                    result = button["action"]()
-                    if result:  # Only return if action returned something
-                        return result
+            button = self._button_at(event.pos)
+            if button:
+                arg = button.get("arg")
+                result = button["action"]() if arg is None else button["action"](arg)
+                if result:  # Only return if action returned something
+                    return result
             
             # Handle input field selection
             self.active_input = None
@@ -166,19 +234,43 @@ class GameMenu:
     def quick_match(self):
         return ("quick_match", "", "")
     
+    def _text(self, size, text, color):
+        """Render text once and reuse the surface on later frames"""
+        key = (text, color, size)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface, _ = ARIAL.render(text, color, size=size)
+            self._text_cache[key] = surface
+        return surface
+
+    def _button_at(self, pos):
+        """Get the button of the current state under a position, or None"""
+        index = pygame.Rect(pos, (1, 1)).collidelist(self._button_rects.get(self.state, []))
+        return self.buttons[self.state][index] if index >= 0 else None
+
+    def _render_button(self, button, color):
+        """Render a button's background, border and label into its own surface"""
+        surface = pygame.Surface(button["rect"].size)
+        surface.fill(color)
+        pygame.draw.rect(surface, BLACK, surface.get_rect(), 2)
+        text_surface = self._text(FONT_SIZE, button["text"], BLACK)
+        surface.blit(text_surface, text_surface.get_rect(center=surface.get_rect().center))
+        return surface.convert()
+
     def draw_button(self, button, hover=False):
-        color = LIGHT_GRAY if hover else GRAY
-        pygame.draw.rect(self.screen, color, button["rect"])
-        pygame.draw.rect(self.screen, BLACK, button["rect"], 2)
-        text_surface, text_rect = FONT.render(button["text"], BLACK)
-        text_rect.center = button["rect"].center
-        self.screen.blit(text_surface, text_rect)
+        self.screen.blit(button["surf_hover" if hover else "surf_idle"], button["rect"])
     
-    def draw_input_field(self, rect, text, active):
+    def draw_input_field(self, name, text, active):
+        rect = self.input_fields[name]
         pygame.draw.rect(self.screen, WHITE, rect)
         pygame.draw.rect(self.screen, BLUE if active else BLACK, rect, 2)
-        text_surface, text_rect = FONT.render(text, BLACK)
-        text_rect.midleft = (rect.left + 10, rect.centery)
+        # Typed text changes with every keystroke, so keep only the latest render per field
+        cached = self._field_text.get(name)
+        if cached is None or cached[0] != text:
+            cached = (text, ARIAL.render(text, BLACK, size=FONT_SIZE)[0])
+            self._field_text[name] = cached
+        text_surface = cached[1]
+        text_rect = text_surface.get_rect(midleft=(rect.left + 10, rect.centery))
         self.screen.blit(text_surface, text_rect)
     
     def draw(self):
@@ -186,100 +278,151 @@ class GameMenu:
         
         # Draw error message if any
         if self.error_message and self.error_timer > 0:
-            text_surface, text_rect = SMALL_FONT.render(self.error_message, RED)
+            text_surface = self._text(SMALL_FONT_SIZE, self.error_message, RED)
+            text_rect = text_surface.get_rect()
             text_rect.centerx = WINDOW_SIZE[0] // 2
             text_rect.bottom = WINDOW_SIZE[1] - 20
             self.screen.blit(text_surface, text_rect)
             self.error_timer -= 1
         
         if self.state == "username":
-            title_surface, title_rect = FONT.render("Enter Your Username", BLACK)
+            title_surface = self._text(FONT_SIZE, "Enter Your Username", BLACK)
+            title_rect = title_surface.get_rect()
             title_rect.centerx = WINDOW_SIZE[0] // 2
             title_rect.top = 150
             self.screen.blit(title_surface, title_rect)
             
             self.draw_input_field(
-                self.input_fields["username"],
+                "username",
                 self.username,
                 self.active_input == "username"
             )
         
         elif self.state in ["create", "join"]:
             title = "Create Game" if self.state == "create" else "Join Game"
-            title_surface, title_rect = FONT.render(title, BLACK)
+            title_surface = self._text(FONT_SIZE, title, BLACK)
+            title_rect = title_surface.get_rect()
             title_rect.centerx = WINDOW_SIZE[0] // 2
             title_rect.top = 100
             self.screen.blit(title_surface, title_rect)
             
-            name_label, _ = SMALL_FONT.render("Game Name:", BLACK)
+            name_label = self._text(SMALL_FONT_SIZE, "Game Name:", BLACK)
             self.screen.blit(name_label, (250, 170))
             
-            pass_label, _ = SMALL_FONT.render("Password (optional):", BLACK)
+            pass_label = self._text(SMALL_FONT_SIZE, "Password (optional):", BLACK)
             self.screen.blit(pass_label, (250, 270))
             
             self.draw_input_field(
-                self.input_fields["game_name"],
+                "game_name",
                 self.game_name,
                 self.active_input == "game_name"
             )
             
             self.draw_input_field(
-                self.input_fields["password"],
+                "password",
                 "*" * len(self.password),
                 self.active_input == "password"
             )
         
         # Draw buttons for current state
+        hovered = self._button_at(pygame.mouse.get_pos())
         for button in self.buttons.get(self.state, []):
-            hover = button["rect"].collidepoint(pygame.mouse.get_pos())
-            self.draw_button(button, hover)
+            self.draw_button(button, button is hovered)
+
+        # Keep redrawing while the error message counts down
+        self._dirty = self.error_timer > 0
 
-@dataclass
+@dataclass(slots=True)
 class TicTacToeState(GameState):
     """Game state for Tic-tac-toe that works for both client and server"""
-    board: List[List[str]] = field(default_factory=lambda: [['' for _ in range(3)] for _ in range(3)])
-    current_player: str = 'X'  # X always goes first
-    my_symbol: Optional[str] = None  # Used by client to track their symbol
+    # One bitboard per symbol, bit (row * 3 + col) is set where that symbol has played
+    x_bb: int = 0
+    o_bb: int = 0
+    current_player: Optional[int] = X  # X always goes first
+    my_symbol: Optional[int] = None  # Used by client to track their symbol
+    winner: Optional[int] = None  # Symbol of the winner, sent as an int like the board
     is_your_turn: bool = False  # Track if it's this client's turn
+    # Perspectives keyed by player index, cleared whenever an update is applied
+    _perspectives: Dict[int, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def board(self) -> Tuple[Tuple[int, ...], ...]:
+        """Board as rows of X, O or EMPTY as sent over the network"""
+        return _board_rows(self.x_bb, self.o_bb)
+
+    @board.setter
+    def board(self, rows: List[List[int]]) -> None:
+        self.x_bb = self.o_bb = 0
+        for row, cells in enumerate(rows):
+            for col, cell in enumerate(cells):
+                if cell == X:
+                    self.x_bb |= 1 << (row * 3 + col)
+                elif cell == O:
+                    self.o_bb |= 1 << (row * 3 + col)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], *args, **kwargs) -> "TicTacToeState":
+        """Create a state from a dictionary, also reading the board rows sent to clients"""
+        # Explicit super() arguments, the zero-argument form breaks on slotted dataclasses
+        state = super(TicTacToeState, cls).from_dict(data, *args, **kwargs)
+        if "board" in data:
+            state.board = data["board"]
+        return state
+
+    def cell(self, row: int, col: int) -> int:
+        """Get the symbol at a position, or EMPTY"""
+        bit = 1 << (row * 3 + col)
+        if self.x_bb & bit:
+            return X
+        if self.o_bb & bit:
+            return O
+        return EMPTY
 
     def get_player_perspective(self, player_index: int) -> Dict[str, Any]:
         """Get the game state from a specific player's perspective"""
-        state = super().get_player_perspective(player_index)
-        player_symbol = "X" if player_index == 0 else "O"
-        state.update({
-            "board": self.board,
-            "current_player": self.current_player,
-            "winner": self.winner,
-            "my_symbol": player_symbol,
-            "is_your_turn": (self.current_player == player_symbol)
-        })
-        return state
+        perspective = self._perspectives.get(player_index)
+        if perspective is None:
+            player_symbol = _player_symbol(player_index)
+            # Built in one literal instead of extending the base class's dict
+            perspective = {
+                "game_over": self.game_over,
+                "winner": self.winner,
+                "phase": self.phase,
+                "board": self.board,
+                "current_player": self.current_player,
+                "my_symbol": player_symbol,
+                "is_your_turn": self.current_player == player_symbol,
+            }
+            self._perspectives[player_index] = perspective
+        return perspective
 
     def is_valid(self, cmd: Command, player_index: int) -> Tuple[bool, str]:
         """Validate if a move is valid"""
         # Get player's symbol
-        player_symbol = "X" if player_index == 0 else "O"
+        player_symbol = _player_symbol(player_index)
         
         # Verify it's the player's turn
         if player_symbol != self.current_player:
-            return False, f"Not your turn - it's {self.current_player}'s turn"
+            return False, f"Not your turn - it's {SYMBOL_NAMES.get(self.current_player)}'s turn"
 
         # Validate move coordinates
-        try:
-            row, col = cmd.data["row"], cmd.data["col"]
-        except KeyError:
+        data = cmd.data
+        row = data.get("row")
+        col = data.get("col")
+        if row is None or col is None:
             return False, "Invalid command: missing row or col"
 
         # Check if move is in bounds and cell is empty
         if not (0 <= row < 3 and 0 <= col < 3):
             return False, f"Invalid move: position ({row}, {col}) is out of bounds"
-        if self.board[row][col]:
+        if not legal_mask(self.x_bb, self.o_bb) >> (row * 3 + col) & 1:
             return False, f"Invalid move: position ({row}, {col}) is already occupied"
 
         return True, ""
 
     def apply(self, update: Update) -> None:
         """Apply an update to the game state"""
+        self._perspectives.clear()
         if update.update_type == UpdateType.GAME_STARTED:
             # Initialize game state from server data
             data = update.data
@@ -291,17 +434,24 @@ class TicTacToeState(GameState):
             self.winner = data.get("winner")
             self.phase = GamePhase(data.get("phase", "in_game"))
         elif update.update_type == UpdateType.GAME_STATE_UPDATE:
-            if "row" in update.data and "col" in update.data:
+            data = update.data
+            row, col = data.get("row"), data.get("col")
+            if row is not None and col is not None:
                 # Apply the move
-                row, col = update.data["row"], update.data["col"]
-                symbol = update.data["symbol"]
-                print(f"[TicTacToeState] Applying move: row={row}, col={col}, symbol={symbol}")
-                print(f"[TicTacToeState] Board before: {self.board}")
-                self.board[row][col] = symbol
-                print(f"[TicTacToeState] Board after: {self.board}")
+                symbol = data["symbol"]
+                debug = log.isEnabledFor(logging.DEBUG)
+                if debug:
+                    log.debug("Applying move: row=%s, col=%s, symbol=%s", row, col, symbol)
+                    log.debug("Board before: %s", self.board)
+                if symbol == X:
+                    self.x_bb |= 1 << (row * 3 + col)
+                else:
+                    self.o_bb |= 1 << (row * 3 + col)
+                if debug:
+                    log.debug("Board after: %s", self.board)
                 
                 # Update turn information
-                self.current_player = 'O' if symbol == 'X' else 'X'
+                self.current_player = O if symbol == X else X
                 self.is_your_turn = (self.current_player == self.my_symbol)
                 
                 # Then check for win/draw
@@ -318,30 +468,18 @@ class TicTacToeState(GameState):
                     self.current_player = None
                     self.is_your_turn = False
 
-    def check_winner(self) -> str | None:
-        """Check if there's a winner on the board"""
-        # Check rows and columns
-        for i in range(3):
-            if self.board[i][0] == self.board[i][1] == self.board[i][2] != '':
-                return self.board[i][0]
-            if self.board[0][i] == self.board[1][i] == self.board[2][i] != '':
-                return self.board[0][i]
-        
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != '':
-            return self.board[0][0]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != '':
-            return self.board[0][2]
-        
-        return None
+    def check_winner(self) -> Optional[int]:
+        """Symbol of the player with a line on the board, if any"""
+        return (None, X, O)[check_winner_bb(self.x_bb, self.o_bb)]
 
     def is_draw(self) -> bool:
         """Check if the game is a draw"""
-        return all(all(cell != '' for cell in row) for row in self.board)
+        return legal_mask(self.x_bb, self.o_bb) == 0
 
     def is_valid_move(self, row: int, col: int) -> bool:
         """Check if a move is valid at the given position"""
-        return 0 <= row < 3 and 0 <= col < 3 and self.board[row][col] == ''
+        # Checked per row and column, so (0, 3) is not read as (1, 0)
+        return 0 <= row < 3 and 0 <= col < 3 and not (self.x_bb | self.o_bb) >> (row * 3 + col) & 1
 
 
 class TicTacToeServer(NexusServer):
@@ -352,7 +490,7 @@ class TicTacToeServer(NexusServer):
 
 class TicTacToeGame(NexusGame[TicTacToeState]):
     def __init__(self):
-        print("[Client] Initializing TicTacToe game")
+        log.debug("Initializing TicTacToe game")
         self.screen = pygame.display.set_mode(WINDOW_SIZE)
         pygame.display.set_caption("Tic Tac Toe")
         self.menu = GameMenu(self.screen)
@@ -372,12 +510,62 @@ class TicTacToeGame(NexusGame[TicTacToeState]):
         self.GRID_SIZE = 3
         self.BOARD_SIZE = self.CELL_SIZE * self.GRID_SIZE
         
+        # The window is fixed size, so its centre never changes
+        self._screen_centre = (WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] // 2)
+
         # Center the board
         self.board_x = (WINDOW_SIZE[0] - self.BOARD_SIZE) // 2
         self.board_y = (WINDOW_SIZE[1] - self.BOARD_SIZE) // 2
+        self._board_rect = pygame.Rect(self.board_x, self.board_y, self.BOARD_SIZE, self.BOARD_SIZE)
 
-        # Font
-        self.font = pygame.freetype.SysFont('Arial', 36)
+        # Screen position of each cell's centre, indexed [row][col]
+        self._cell_centres = [
+            [(self.board_x + col * self.CELL_SIZE + self.CELL_SIZE // 2,
+              self.board_y + row * self.CELL_SIZE + self.CELL_SIZE // 2)
+             for col in range(self.GRID_SIZE)]
+            for row in range(self.GRID_SIZE)
+        ]
+
+        # Font size of the board glyphs and status text
+        self.font_size = 36
+
+        # Background with the grid lines, drawn once
+        self._bg = pygame.Surface(WINDOW_SIZE)
+        self._bg.fill(self.WHITE)
+        # Grid lines are axis aligned, so each is a 2 pixel wide filled rect
+        grid_lines = [
+            rect
+            for i in range(1, self.GRID_SIZE)
+            for rect in (
+                # Vertical line
+                (self.board_x + i * self.CELL_SIZE - 1, self.board_y, 2, self.BOARD_SIZE),
+                # Horizontal line
+                (self.board_x, self.board_y + i * self.CELL_SIZE - 1, self.BOARD_SIZE, 2),
+            )
+        ]
+        for rect in grid_lines:
+            self._bg.fill(self.BLACK, rect)
+        self._bg = self._bg.convert()
+
+        # Symbol glyphs, rendered once
+        self._glyphs = {
+            symbol: ARIAL.render(SYMBOL_NAMES[symbol], self.BLACK, size=self.font_size)[0].convert_alpha()
+            for symbol in PLAYER_SYMBOLS
+        }
+
+        # Rendered text surfaces keyed by (text, color, size)
+        self._text_cache = {}
+
+        # Whether the whole screen needs to be redrawn
+        self._dirty = True
+        # Areas of the playing screen to redraw when the rest is unchanged
+        self._dirty_rects = []
+
+        # Event handler for each state that handles input
+        self._event_dispatch = {
+            "menu": self._handle_menu_event,
+            "playing": self._handle_playing_event,
+        }
 
         # Game state
         self.game_state = None
@@ -392,114 +580,187 @@ class TicTacToeGame(NexusGame[TicTacToeState]):
             "text": "Back to Menu",
             "hover": False
         }
+
+        # Render every fixed string up front so nothing is rasterized during play
+        for text in ("Connecting...", "Waiting for opponent...", "Your turn!", "Opponent's turn!",
+                     "Draw!", "Winner: X!", "Winner: O!", self.back_button["text"]):
+            self._text(self.font_size, text, self.BLACK)
+
+        # Full width band the turn status is drawn in, tall enough for any status text
+        status_height = max(
+            self._text(self.font_size, text, self.BLACK).get_height()
+            for text in ("Your turn!", "Opponent's turn!")
+        )
+        status_bottom = self.back_button["rect"].top - 20
+        self._status_rect = pygame.Rect(0, status_bottom - status_height, WINDOW_SIZE[0], status_height)
         
-        print("[Client] Game window initialized")
+        log.debug("Game window initialized")
 
     def run(self):
         """Main game loop"""
         clock = pygame.time.Clock()
         
         while True:
+            dispatch = self._event_dispatch
+            # Every screen is idle until input or a server update arrives, so
+            # sleep in SDL instead of polling
+            event = pygame.event.wait(IDLE_WAIT_MS)
             events = pygame.event.get()
+            if event.type != NOEVENT:
+                events.insert(0, event)
             for event in events:
-                if event.type == pygame.QUIT:
+                event_type = event.type
+                if event_type == QUIT:
                     if self.client:
                         self.client.close()
                     pygame.quit()
                     return
-                
-                if self.state == "menu":
-                    action = self.menu.handle_event(event)
-                    if isinstance(action, tuple):
-                        action_type, game_name, password = action
-                        self.state = "connecting"
-                        
-                        # Initialize client if not done yet
-                        if not self.client:
-                            self.client = NexusClient(self.host, self.port)
-                            self.client.connect()
-                        
-                        if action_type == "create":
-                            print(f"Creating game: {game_name}")
-                            self.client.send(Command(CommandType.CREATE_GAME, {
-                                "game_name": game_name,
-                                "password": password,
-                                "player_name": self.menu.username
-                            }))
-                        elif action_type == "join":
-                            print(f"Joining game: {game_name}")
-                            self.client.send(Command(CommandType.JOIN_GAME, {
-                                "game_name": game_name,
-                                "password": password,
-                                "player_name": self.menu.username
-                            }))
-                        else:  # quick_match
-                            print("Finding game via matchmaking")
-                            self.client.send(Command(CommandType.FIND_GAME, {
-                                "player_name": self.menu.username
-                            }))
-                        self.state = "waiting"
-                elif self.state == "playing":
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        mouse_pos = event.pos
-                        if self.game_state and self.game_state.game_over:
-                            # Handle back button click when game is over
-                            if self.back_button["rect"].collidepoint(mouse_pos):
-                                self.state = "menu"
-                                self.game_state = None
-                                if self.client:
-                                    self.client.close()
-                                    self.client = None
-                                # Reset menu state to main menu
-                                self.menu.set_state("menu")
-                                # Clear game-specific fields
-                                self.menu.game_name = ""
-                                self.menu.password = ""
-                        elif self.game_state and self.game_state.is_your_turn:
-                            self.handle_click(mouse_pos)
-                    elif event.type == pygame.MOUSEMOTION and self.game_state and self.game_state.game_over:
-                        # Handle button hover
-                        self.back_button["hover"] = self.back_button["rect"].collidepoint(event.pos)
+
+                if event_type != MOUSEMOTION:
+                    self._dirty = True
+
+                # Looked up per event since a handler can change the state
+                handler = dispatch.get(self.state)
+                if handler:
+                    handler(event)
             
-            # Process game updates
+            # Process every game update the client's reader thread has queued
             if self.client and self.state in ["waiting", "playing"]:
-                update = self.client.receive()
-                if update:
-                    if update.update_type == UpdateType.GAME_STARTED:
-                        print("Game started!")
-                        self.game_state = TicTacToeState()
-                        self.game_state.apply(update)
-                        self.state = "playing"
-                    elif update.update_type == UpdateType.GAME_STATE_UPDATE:
-                        if not self.game_state:
-                            self.game_state = TicTacToeState()
-                        self.game_state.apply(update)
-                    elif update.update_type == UpdateType.ERROR:
-                        print(f"Error: {update.data.get('message')}")
-                        self.menu.show_error(update.data.get("message", "Unknown error"))
-                        self.state = "menu"
+                queue = self.client.message_queue
+                while queue and self.state != "menu":
+                    update = self.client.receive()
+                    if update:
+                        self.handle_update(update)
             
-            self.draw()
+            # Only redraw when something visible changed
+            if self._dirty or (self.state == "menu" and self.menu._dirty):
+                self.draw()
+                self._dirty = False
+                self._dirty_rects.clear()
+            elif self._dirty_rects:
+                self.draw_rects(self._dirty_rects)
+                self._dirty_rects.clear()
             clock.tick(60)
 
+    def handle_update(self, update: Update):
+        """Handle an update received from the server"""
+        if update.update_type == UpdateType.GAME_STARTED:
+            log.info("Game started!")
+            self.game_state = TicTacToeState()
+            self.game_state.apply(update)
+            self.state = "playing"
+            self._dirty = True
+        elif update.update_type == UpdateType.GAME_STATE_UPDATE:
+            data = update.data
+            row, col = data.get("row"), data.get("col")
+            if not self.game_state:
+                self.game_state = TicTacToeState()
+                self._dirty = True
+            elif row is not None and col is not None and self.game_state.cell(row, col) == data.get("symbol"):
+                # A replayed move is already on the board; applying it again
+                # would flip the turn and redraw identical pixels
+                log.debug("Ignoring already applied move: row=%s, col=%s", row, col)
+                return
+            self.game_state.apply(update)
+            if self.game_state.game_over or row is None or col is None:
+                # The back button appears, so redraw everything
+                self._dirty = True
+            else:
+                # Only the played cell and the turn status changed
+                self._dirty_rects.append(pygame.Rect(
+                    self.board_x + col * self.CELL_SIZE, self.board_y + row * self.CELL_SIZE,
+                    self.CELL_SIZE, self.CELL_SIZE
+                ))
+                self._dirty_rects.append(self._status_rect)
+        elif update.update_type == UpdateType.ERROR:
+            log.warning("Error: %s", update.data.get('message'))
+            self.menu.show_error(update.data.get("message", "Unknown error"))
+            self.state = "menu"
+            self._dirty = True
+
+    def _handle_menu_event(self, event):
+        """Pass an event to the menu and start connecting if it returns an action"""
+        action = self.menu.handle_event(event)
+        if not isinstance(action, tuple):
+            return
+        action_type, game_name, password = action
+        self.state = "connecting"
+        
+        # Initialize client if not done yet
+        if not self.client:
+            self.client = NexusClient(self.host, self.port)
+            try:
+                self.client.connect()
+            except ConnectionError as e:
+                log.warning("Could not connect: %s", e)
+                self.client = None
+                self.menu.show_error("Could not connect to server")
+                self.state = "menu"
+                return
+        
+        if action_type == "create":
+            log.info("Creating game: %s", game_name)
+            self.client.send(Command(CommandType.CREATE_GAME, {
+                "game_name": game_name,
+                "password": password,
+                "player_name": self.menu.username
+            }))
+        elif action_type == "join":
+            log.info("Joining game: %s", game_name)
+            self.client.send(Command(CommandType.JOIN_GAME, {
+                "game_name": game_name,
+                "password": password,
+                "player_name": self.menu.username
+            }))
+        else:  # quick_match
+            log.info("Finding game via matchmaking")
+            self.client.send(Command(CommandType.FIND_GAME, {
+                "player_name": self.menu.username
+            }))
+        self.state = "waiting"
+
+    def _handle_playing_event(self, event):
+        """Handle board clicks, and the back button once the game is over"""
+        event_type = event.type
+        if event_type == MOUSEBUTTONDOWN:
+            mouse_pos = event.pos
+            if self.game_state and self.game_state.game_over:
+                # Handle back button click when game is over
+                if self.back_button["rect"].collidepoint(mouse_pos):
+                    self.state = "menu"
+                    self.game_state = None
+                    if self.client:
+                        self.client.close()
+                        self.client = None
+                    # Reset menu state to main menu
+                    self.menu.set_state("menu")
+                    # Clear game-specific fields
+                    self.menu.game_name = ""
+                    self.menu.password = ""
+            elif self.game_state and self.game_state.is_your_turn:
+                self.handle_click(mouse_pos)
+        elif event_type == MOUSEMOTION and self.game_state and self.game_state.game_over:
+            # Handle button hover
+            hover = self.back_button["rect"].collidepoint(event.pos)
+            if hover != self.back_button["hover"]:
+                self.back_button["hover"] = hover
+                self._dirty_rects.append(self.back_button["rect"])
+
     def handle_click(self, pos: Tuple[int, int]):
         """Handle mouse clicks during the game"""
         if not self.game_state or self.game_state.game_over:
             return
             
-        # Convert screen position to grid position
-        grid_x = (self.screen.get_width() - self.BOARD_SIZE) // 2
-        grid_y = (self.screen.get_height() - self.BOARD_SIZE) // 2
-        
-        if not (grid_x <= pos[0] <= grid_x + self.BOARD_SIZE and
-                grid_y <= pos[1] <= grid_y + self.BOARD_SIZE):
+        # Convert screen position to grid position, the rect excludes its
+        # right and bottom edges so row and col always land in 0..2
+        if not self._board_rect.collidepoint(pos):
             return
             
-        col = (pos[0] - grid_x) // self.CELL_SIZE
-        row = (pos[1] - grid_y) // self.CELL_SIZE
+        col = (pos[0] - self.board_x) // self.CELL_SIZE
+        row = (pos[1] - self.board_y) // self.CELL_SIZE
         
         # Check if the cell is empty
-        if self.game_state.board[row][col]:
+        if not self.game_state.is_valid_move(row, col):
             return
             
         # Send move command with the player's symbol
@@ -510,51 +771,58 @@ class TicTacToeGame(NexusGame[TicTacToeState]):
         })
         self.client.send(cmd)
 
+    def _text(self, size, text, color):
+        """Render text once and reuse the surface on later frames"""
+        key = (text, color, size)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface, _ = ARIAL.render(text, color, size=size)
+            self._text_cache[key] = surface
+        return surface
+
     def draw(self):
-        self.screen.fill(self.WHITE)
+        self._draw_screen()
+        pygame.display.flip()
+
+    def draw_rects(self, rects):
+        """Redraw and present only the given areas of the screen"""
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self._draw_screen()
+        self.screen.set_clip(None)
+        pygame.display.update(rects)
+
+    def _draw_screen(self):
+        if self.state == "playing" and self.game_state:
+            # Background already contains the grid
+            self.screen.blit(self._bg, (0, 0))
+        else:
+            self.screen.fill(self.WHITE)
         
         if self.state == "menu":
             self.menu.draw()
         elif self.state == "connecting":
-            text_surface, text_rect = self.font.render("Connecting...", self.BLACK)
-            text_rect.center = (self.screen.get_width() // 2, self.screen.get_height() // 2)
+            text_surface = self._text(self.font_size, "Connecting...", self.BLACK)
+            text_rect = text_surface.get_rect(center=self._screen_centre)
             self.screen.blit(text_surface, text_rect)
         elif self.state == "waiting":
-            text_surface, text_rect = self.font.render("Waiting for opponent...", self.BLACK)
-            text_rect.center = (self.screen.get_width() // 2, self.screen.get_height() // 2)
+            text_surface = self._text(self.font_size, "Waiting for opponent...", self.BLACK)
+            text_rect = text_surface.get_rect(center=self._screen_centre)
             self.screen.blit(text_surface, text_rect)
         elif self.state == "playing" and self.game_state:
-            # Draw grid
-            grid_x = (self.screen.get_width() - self.BOARD_SIZE) // 2
-            grid_y = (self.screen.get_height() - self.BOARD_SIZE) // 2
-            
-            # Draw grid lines
-            for i in range(1, self.GRID_SIZE):
-                # Vertical lines
-                pygame.draw.line(self.screen, self.BLACK,
-                               (grid_x + i * self.CELL_SIZE, grid_y),
-                               (grid_x + i * self.CELL_SIZE, grid_y + self.BOARD_SIZE), 2)
-                # Horizontal lines
-                pygame.draw.line(self.screen, self.BLACK,
-                               (grid_x, grid_y + i * self.CELL_SIZE),
-                               (grid_x + self.BOARD_SIZE, grid_y + i * self.CELL_SIZE), 2)
-            
             # Draw X's and O's
-            for row in range(self.GRID_SIZE):
-                for col in range(self.GRID_SIZE):
-                    cell = self.game_state.board[row][col]
+            for row, cells in enumerate(self.game_state.board):
+                centres = self._cell_centres[row]
+                for col, cell in enumerate(cells):
                     if cell:
-                        x = grid_x + col * self.CELL_SIZE + self.CELL_SIZE // 2
-                        y = grid_y + row * self.CELL_SIZE + self.CELL_SIZE // 2
-                        text_surface, text_rect = self.font.render(cell, self.BLACK)
-                        text_rect.center = (x, y)
-                        self.screen.blit(text_surface, text_rect)
+                        glyph = self._glyphs[cell]
+                        self.screen.blit(glyph, glyph.get_rect(center=centres[col]))
             
             # Draw game status
             status_text = ""
             if self.game_state.game_over:
                 if self.game_state.winner:
-                    status_text = f"Winner: {self.game_state.winner}!"
+                    status_text = f"Winner: {SYMBOL_NAMES[self.game_state.winner]}!"
                 else:
                     status_text = "Draw!"
                 
@@ -562,8 +830,8 @@ class TicTacToeGame(NexusGame[TicTacToeState]):
                 button_color = self.LIGHT_GRAY if self.back_button["hover"] else self.GRAY
                 pygame.draw.rect(self.screen, button_color, self.back_button["rect"])
                 pygame.draw.rect(self.screen, self.BLACK, self.back_button["rect"], 2)
-                text_surface, text_rect = self.font.render(self.back_button["text"], self.BLACK)
-                text_rect.center = self.back_button["rect"].center
+                text_surface = self._text(self.font_size, self.back_button["text"], self.BLACK)
+                text_rect = text_surface.get_rect(center=self.back_button["rect"].center)
                 self.screen.blit(text_surface, text_rect)
             else:
                 # Use is_your_turn from game state to determine whose turn it is
@@ -572,12 +840,11 @@ class TicTacToeGame(NexusGame[TicTacToeState]):
                 else:
                     status_text = "Opponent's turn!"
             
-            text_surface, text_rect = self.font.render(status_text, self.BLACK)
-            text_rect.centerx = self.screen.get_width() // 2
+            text_surface = self._text(self.font_size, status_text, self.BLACK)
+            text_rect = text_surface.get_rect()
+            text_rect.centerx = self._screen_centre[0]
             text_rect.bottom = self.back_button["rect"].top - 20  # Position above the back button
             self.screen.blit(text_surface, text_rect)
-        
-        pygame.display.flip()
 
     def draw_x(self, x: int, y: int):
         size = self.CELL_SIZE // 3
@@ -610,13 +877,18 @@ def main():
     parser.add_argument('mode', choices=['server', 'client'], help='Run in server or client mode')
     parser.add_argument('--host', default='localhost', help='Server host (client mode only)')
     parser.add_argument('--port', type=int, default=8765, help='Server port')
+    parser.add_argument('--verbose', action='store_true', help='Log every message and state change')
     
     args = parser.parse_args()
+    # Lifecycle messages from the framework and the game are logged at INFO, per-message
+    # tracing only with --verbose so it is never formatted otherwise
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="[%(name)s] %(message)s")
     
     if args.mode == 'server':
         run_server(args)
     else:
         # Create and run the game directly
+        _client_setup()
         game = TicTacToeGame()
         game.host = args.host
         game.port = args.port
@@ -624,7 +896,8 @@ def main():
 
 def run_server(args):
     """Run the game in server mode"""
-    print(f"[Server] Starting server on port {args.port}")
+    install_uvloop()
+    log.info("Starting server on port %s", args.port)
     server = TicTacToeServer()
     asyncio.run(server.start())
 
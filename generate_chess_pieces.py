@@ -1,4 +1,5 @@
 from PIL import Image, ImageDraw
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 def draw_pawn(draw, color, width, height):
@@ -89,6 +90,11 @@ def draw_king(draw, color, width, height):
     draw.rectangle([width*0.35, height*0.12, width*0.65, height*0.18], fill=color)
 
 def create_piece(name, color):
+    # Skip pieces that were already generated
+    out = f"assets/chess/{color}_{name}.png"
+    if os.path.exists(out):
+        return
+
     # Create a new image with transparency
     size = 100
     img = Image.new('RGBA', (size, size), (255, 255, 255, 0))
@@ -113,14 +119,15 @@ def create_piece(name, color):
     
     # Save the image
     os.makedirs("assets/chess", exist_ok=True)
-    img.save(f"assets/chess/{color}_{name}.png")
+    img.save(out)
 
-# Create all pieces
-pieces = ["king", "queen", "rook", "bishop", "knight", "pawn"]
+if __name__ == "__main__":
+    # Create all pieces
+    pieces = ["king", "queen", "rook", "bishop", "knight", "pawn"]
+    colors = ["white", "black"]
 
-# Generate both white and black pieces
-for name in pieces:
-    create_piece(name, "white")
-    create_piece(name, "black")
+    # Generate both white and black pieces in parallel
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(create_piece, pieces * 2, [c for c in colors for _ in pieces]))
 
-print("Chess pieces generated successfully!") 
\ No newline at end of file
+    print("Chess pieces generated successfully!") 
\ No newline at end of file
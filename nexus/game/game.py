@@ -1,4 +1,5 @@
 import sys
+import logging
 from nexus.network.update import UpdateType
 import pygame
 from typing import List, TypeVar, Generic, Type, get_args
@@ -7,6 +8,7 @@ from nexus.network.client import NexusClient
 from nexus.game.gamestate import GameState, GamePhase
 from nexus.network.command import Command
 
+log = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=GameState)
 
@@ -40,29 +42,30 @@ class NexusGame(Generic[T]):
                 if event.type == pygame.QUIT:
                     self.close()
 
-            # Process game updates from network
-            update = self.client.receive()
-            if update:
-                print("[NexusGame] Received update:", update.__dict__)
-                print("[NexusGame] Processing update type:", update.update_type)
-                if update.update_type == UpdateType.GAME_STARTED:
-                    # Use the actual state class for deserialization
-                    self.game_state = self.state_class.from_dict(update.data)
-                elif self.game_state is None:
-                    print("[NexusGame] Game state is not set, skipping update")
-                elif update.update_type == UpdateType.GAME_STATE_UPDATE:
-                    print("[NexusGame] Applying game state update:", update.data)
-                    print("[NexusGame] Current game state before update:", self.game_state)
-                    self.game_state.apply(update)
-                    print("[NexusGame] Current game state after update:", self.game_state)
-                elif update.update_type == UpdateType.GAME_OVER:
-                    self.game_state.winner = update.data["winner"]
-                    self.game_state.game_over = True
-                    self.game_state.phase = GamePhase.END_GAME
-                elif update.update_type == UpdateType.ERROR:
-                    print("[NexusGame] Error:", update.data["message"])
-                else:
-                    print("[NexusGame] Unknown update type:", update.update_type)
+            # Process every game update that arrived since the last frame
+            while self.client.message_queue:
+                update = self.client.receive()
+                if update:
+                    log.debug("Received update: %s", update)
+                    log.debug("Processing update type: %s", update.update_type)
+                    if update.update_type == UpdateType.GAME_STARTED:
+                        # Use the actual state class for deserialization
+                        self.game_state = self.state_class.from_dict(update.data)
+                    elif self.game_state is None:
+                        log.warning("Game state is not set, skipping update")
+                    elif update.update_type == UpdateType.GAME_STATE_UPDATE:
+                        log.debug("Applying game state update: %s", update.data)
+                        log.debug("Current game state before update: %s", self.game_state)
+                        self.game_state.apply(update)
+                        log.debug("Current game state after update: %s", self.game_state)
+                    elif update.update_type == UpdateType.GAME_OVER:
+                        self.game_state.winner = update.data["winner"]
+                        self.game_state.game_over = True
+                        self.game_state.phase = GamePhase.END_GAME
+                    elif update.update_type == UpdateType.ERROR:
+                        log.warning("Error: %s", update.data["message"])
+                    else:
+                        log.warning("Unknown update type: %s", update.update_type)
             
             # Process local events and game logic
             self.update(events)
@@ -72,7 +75,7 @@ class NexusGame(Generic[T]):
             clock.tick(self.fps)
 
     def send_command(self, command: Command):
-        print("[NexusGame] Sending command:", command.__dict__)
+        log.debug("Sending command: %s", command)
         self.client.send(command)
 
     def update(self, events: List[pygame.event.EventType]):
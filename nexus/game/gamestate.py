@@ -13,7 +13,7 @@ class GamePhase(str, Enum):
     END_GAME = "end_game"
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState(Serializable):
     """Base class for game states"""
     players: List[NexusPlayer] = field(default_factory=list)
@@ -29,10 +29,18 @@ class GameState(Serializable):
             "phase": self.phase
         }
 
+    def is_perspective_invariant(self) -> bool:
+        """Whether every player gets the same perspective, so it is only built and serialized once"""
+        return False
+
     def is_valid(self, cmd: Command, player_index: int) -> Tuple[bool, str]:
         """Validate if a command is valid for the current game state"""
         raise NotImplementedError("Subclasses must implement this method")
 
+    def get_update_data(self, cmd: Command) -> Dict[str, Any]:
+        """Get the data broadcast to all players after a valid command"""
+        return cmd.data
+
     def apply(self, update: Update) -> None:
         """Apply an update to the game state"""
         raise NotImplementedError("Subclasses must implement this method")
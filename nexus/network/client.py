@@ -1,78 +1,109 @@
+import asyncio
+import logging
 import websocket
-import json
 import threading
-from queue import Queue
+from collections import deque
+from typing import Deque, Optional, Union
 from nexus.network.command import Command, CommandType
 from nexus.network.update import Update
+from nexus.network.serializable import MSGPACK_HEADER, loads_message, msgpack
+
+log = logging.getLogger(__name__)
 
 class NexusClient:
     """Base client class for the Nexus framework"""
-    def __init__(self, host, port) -> None:
+    def __init__(self, host: str, port: int) -> None:
         self.host = host
         self.port = port
         self.ws = None
         self.connected = False
-        self.message_queue = Queue()
+        # Set by on_open so connect() can block without spinning
+        self._connected_event = threading.Event()
+        # Filled by the websocket thread, drained by receive(); deque appends and
+        # pops are atomic, so no lock is needed
+        self.message_queue: Deque[Union[str, bytes]] = deque()
+        # Commands sent while disconnected, flushed once the connection reopens
+        self._pending: Deque[Command] = deque(maxlen=256)
+        # Whether the server answered in MessagePack, so commands can be sent that way too
+        self._binary = False
         # Store info needed for reconnection
         self.current_game = None
         self.player_name = None
         self.game_password = None
-        print(f"[NexusClient] Initialized for {host}:{port}")
+        # Set by receive_async so the websocket thread can wake the event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._message_ready: Optional[asyncio.Event] = None
+        log.debug("Initialized for %s:%s", host, port)
 
     def on_message(self, ws, message):
-        print(f"[NexusClient] Received message: {message}")
-        self.message_queue.put(message)
+        log.debug("Received message: %s", message)
+        if not self._binary and isinstance(message, bytes):
+            self._binary = True
+        self.message_queue.append(message)
+        message_ready = self._message_ready
+        if message_ready is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(message_ready.set)
 
     def on_error(self, ws, error):
-        print(f"[NexusClient] Error: {error}")
+        log.warning("Error: %s", error)
 
     def on_close(self, ws, close_status_code, close_msg):
-        print(f"[NexusClient] Connection closed (status: {close_status_code}, msg: {close_msg})")
+        log.info("Connection closed (status: %s, msg: %s)", close_status_code, close_msg)
         self.connected = False
+        self._connected_event.clear()
         # Clean up the WebSocket object
         self.ws = None
         # Notify any listeners that we've disconnected
-        print("[NexusClient] Connection to server lost - attempting to reconnect...")
+        log.info("Connection to server lost - attempting to reconnect...")
         # Try to reconnect if we were in a game
         if self.current_game and self.player_name:
             self.reconnect()
 
     def on_open(self, ws):
-        print("[NexusClient] Connection opened")
+        log.info("Connection opened")
+        # A reconnect may reach a server without msgpack, so start over in JSON
+        self._binary = False
         self.connected = True
+        self._connected_event.set()
         # If we were in a game, rejoin it
         if self.current_game and self.player_name:
-            print(f"[NexusClient] Attempting to rejoin game: {self.current_game}")
+            log.info("Attempting to rejoin game: %s", self.current_game)
             self.send(Command(CommandType.JOIN_GAME, {
                 "game_name": self.current_game,
                 "player_name": self.player_name,
                 "password": self.game_password
             }))
+        # Then send what the game tried to send while we were offline, in order
+        while self._pending:
+            self.send(self._pending.popleft())
 
     def on_ping(self, ws, message):
         """Called when server sends a ping"""
-        print("[NexusClient] Received ping from server")
+        log.debug("Received ping from server")
 
     def on_pong(self, ws, message):
         """Called when server responds to our ping"""
-        print("[NexusClient] Received pong from server")
+        log.debug("Received pong from server")
 
-    def connect(self):
-        print("[NexusClient] Connecting...")
-        websocket.enableTrace(True)
-        self.ws = websocket.WebSocketApp(
+    def connect(self) -> None:
+        log.info("Connecting...")
+        # Frame-level tracing is only worth its cost when debugging
+        websocket.enableTrace(log.isEnabledFor(logging.DEBUG))
+        self.ws = ws = websocket.WebSocketApp(
             f"ws://{self.host}:{self.port}",
             on_message=self.on_message,
             on_error=self.on_error,
             on_close=self.on_close,
             on_open=self.on_open,
             on_ping=self.on_ping,
-            on_pong=self.on_pong
+            on_pong=self.on_pong,
+            # Offer MessagePack; servers that don't know the header keep using JSON
+            header=[f"{MSGPACK_HEADER}: 1"] if msgpack is not None else None
         )
         
         # Run the websocket connection in a separate thread
         self.ws_thread = threading.Thread(
-            target=lambda: self.ws.run_forever(
+            target=lambda: ws.run_forever(
                 ping_interval=30,  # Check connection every 30 seconds
                 ping_timeout=10    # Wait 10 seconds for pong response
             )
@@ -81,36 +112,47 @@ class NexusClient:
         self.ws_thread.start()
         
         # Wait for connection to be established
-        while not self.connected:
-            pass
-        print("[NexusClient] Connected successfully")
+        if not self._connected_event.wait(timeout=10):
+            # Stop the websocket thread so a late handshake can't leave a stray connection
+            ws.close()
+            raise ConnectionError(f"Timed out connecting to ws://{self.host}:{self.port}")
+        log.info("Connected successfully")
 
-    def reconnect(self):
+    def reconnect(self) -> None:
         """Try to reconnect to the server"""
         import time
         retry_delay = 5  # Start with 5 second delay
         max_delay = 30   # Maximum delay between retries
         
         while not self.connected:
-            print(f"[NexusClient] Attempting to reconnect in {retry_delay} seconds...")
+            log.info("Attempting to reconnect in %s seconds...", retry_delay)
             time.sleep(retry_delay)
             try:
                 self.connect()
                 if self.connected:
-                    print("[NexusClient] Reconnection successful")
+                    log.info("Reconnection successful")
                     return
             except Exception as e:
-                print(f"[NexusClient] Reconnection failed: {str(e)}")
+                log.warning("Reconnection failed: %s", e)
                 # Increase delay for next attempt, but don't exceed max_delay
                 retry_delay = min(retry_delay * 2, max_delay)
 
-    def send(self, cmd: Command):
+    def send(self, cmd: Command) -> None:
         if not self.connected:
-            print("[NexusClient] Error: Not connected")
+            # Queued as is, serialized only once we are back online
+            log.debug("Not connected, queueing command: %s", cmd.command_type)
+            self._pending.append(cmd)
             return
         
-        message = cmd.to_json()
-        print(f"[NexusClient] Sending command: {message}")
+        # JSON text frames until the server has answered in binary MessagePack
+        message: Union[str, bytes]
+        if self._binary:
+            message = cmd.to_msgpack()
+            opcode = websocket.ABNF.OPCODE_BINARY
+        else:
+            message = cmd.to_json()
+            opcode = websocket.ABNF.OPCODE_TEXT
+        log.debug("Sending command: %s", message)
         
         # Store game info when joining or creating a game
         if cmd.command_type in [CommandType.CREATE_GAME, CommandType.JOIN_GAME]:
@@ -121,33 +163,57 @@ class NexusClient:
             self.player_name = cmd.data.get("player_name")
             # Note: game name will be set when we receive the game assignment
         
-        self.ws.send(message)
+        self.ws.send(message, opcode)
 
-    def receive(self) -> Update:
-        if self.message_queue.empty():
+    def receive(self) -> Optional[Update]:
+        try:
+            message = self.message_queue.popleft()
+        except IndexError:
             return None
             
         try:
-            message = self.message_queue.get_nowait()
-            data = json.loads(message)
-            if "type" in data and data["type"] == "error":
-                print(f"[NexusClient] Received error: {data['message']}")
-                return None
-                
-            # If this is a game assignment from matchmaking, store the game name
-            if "type" in data and data["type"] == "game_assignment":
-                self.current_game = data.get("game_name")
-                
-            return Update(**data)
-        except json.JSONDecodeError:
-            print(f"[NexusClient] Error decoding message: {message}")
+            data = loads_message(message)
+        except ValueError:
+            # Also covers orjson's and msgpack's decode errors
+            log.warning("Error decoding message: %s", message)
+            return None
+        if not isinstance(data, dict):
+            log.warning("Message is not an object: %s", message)
+            return None
+
+        message_type = data.get("type")
+        if message_type == "error":
+            log.warning("Received error: %s", data.get('message'))
             return None
-        except Exception as e:
-            print(f"[NexusClient] Error processing message: {str(e)}")
+            
+        # If this is a game assignment from matchmaking, store the game name
+        if message_type == "game_assignment":
+            self.current_game = data.get("game_name")
+            
+        # Build the Update directly instead of expanding the dict as kwargs
+        try:
+            return Update(data["update_type"], data.get("data", {}))
+        except KeyError:
+            log.warning("Message has no update_type: %s", message)
             return None
 
-    def close(self):
-        print("[NexusClient] Closing connection")
+    async def receive_async(self) -> Update:
+        """Wait for the next update without blocking the event loop"""
+        if self._message_ready is None:
+            self._loop = asyncio.get_running_loop()
+            self._message_ready = asyncio.Event()
+        while True:
+            self._message_ready.clear()
+            update = self.receive()
+            if update:
+                return update
+            if not self.message_queue:
+                await self._message_ready.wait()
+
+    def close(self) -> None:
+        log.info("Closing connection")
+        # Nothing queued while offline is sent after an explicit close
+        self._pending.clear()
         if self.ws and self.connected:
             try:
                 # Send disconnect command
@@ -160,7 +226,7 @@ class NexusClient:
                 self.ws.close()
                 self.ws_thread.join(timeout=1)
             except Exception as e:
-                print(f"[NexusClient] Error during close: {str(e)}")
+                log.warning("Error during close: %s", e)
             finally:
                 self.connected = False
                 self.ws = None
@@ -11,7 +11,7 @@ class CommandType(str, Enum):
     JOIN_GAME = "join_game"
     FIND_GAME = "find_game"
 
-@dataclass
+@dataclass(slots=True)
 class Command(Serializable):
     command_type: CommandType
     data: Dict[str, Any] = field(default_factory=dict)
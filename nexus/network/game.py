@@ -5,7 +5,7 @@ from nexus.network.player import NexusPlayer
 from nexus.network.serializable import Serializable
 
 
-@dataclass
+@dataclass(slots=True)
 class NexusGame(Serializable):
     """Represents a game instance in the Nexus framework"""
     name: str
@@ -15,4 +15,22 @@ class NexusGame(Serializable):
     players: List[NexusPlayer] = field(default_factory=list)
     game_state: Optional[GameState] = None
     is_matchmaking: bool = False
-    data: Dict[str, Any] = field(default_factory=dict)
\ No newline at end of file
+    data: Dict[str, Any] = field(default_factory=dict)
+    # Index in players keyed by player id, kept in step by add_player
+    _player_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # from_dict leaves the list's items as plain dicts
+        for i, p in enumerate(self.players):
+            if isinstance(p, dict):
+                self.players[i] = NexusPlayer.from_dict(p)
+        self._player_index = {p.id: i for i, p in enumerate(self.players)}
+
+    def add_player(self, player: NexusPlayer) -> None:
+        """Add a player to the game"""
+        self._player_index[player.id] = len(self.players)
+        self.players.append(player)
+
+    def player_index(self, player: NexusPlayer) -> int:
+        """Get a player's index in players"""
+        return self._player_index[player.id]
@@ -3,7 +3,7 @@ from typing import Dict, Any, Optional
 from nexus.network.serializable import Serializable
 import time
 
-@dataclass
+@dataclass(slots=True)
 class NexusPlayer(Serializable):
     """Represents a player in the Nexus framework"""
     id: str
@@ -6,7 +6,47 @@ import functools
 
 T = TypeVar('T', bound='Serializable')
 
-def non_serializable(*, repr: bool = False, compare: bool = False):
+# orjson parses and encodes JSON in C and is used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Parse a JSON str or bytes; orjson's decode error subclasses json.JSONDecodeError
+json_loads = orjson.loads if orjson is not None else json.loads
+
+def json_dumps(obj: Any) -> str:
+    """Encode plain data as a JSON string, with orjson when it is installed"""
+    if orjson is not None:
+        # Decoded so messages still go out as text frames; non-str keys are
+        # stringified like json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+# msgpack gives a smaller, faster binary wire format and is used when installed
+try:
+    import msgpack  # type: ignore[import]
+except ImportError:
+    msgpack = None
+
+# Handshake header a client sends to ask for MessagePack frames; the server only
+# answers in binary when it has msgpack too, and the client switches once it does
+MSGPACK_HEADER = "X-Nexus-Msgpack"
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """Encode plain data as MessagePack"""
+    packed: bytes = msgpack.packb(obj, use_bin_type=True)
+    return packed
+
+def loads_message(message: Union[str, bytes]) -> Any:
+    """Parse a websocket message, binary frames are MessagePack and text frames JSON"""
+    if isinstance(message, bytes):
+        if msgpack is None:
+            raise ValueError("Received a binary message but msgpack is not installed")
+        return msgpack.unpackb(message, raw=False)
+    return json_loads(message)
+
+def non_serializable(*, repr: bool = False, compare: bool = False) -> Any:
     """Create a non-serializable field."""
     return field(
         metadata={'non_serializable': True},
@@ -15,77 +55,90 @@ def non_serializable(*, repr: bool = False, compare: bool = False):
         default=None
     )
 
+@functools.lru_cache(maxsize=None)
+def _serialized_field_names(cls: type) -> tuple:
+    """Names of the fields of a dataclass that to_dict includes"""
+    return tuple(
+        f.name for f in fields(cls)
+        # Skip fields marked as non_serializable or starting with underscore
+        if not f.metadata.get('non_serializable', False) and not f.name.startswith('_')
+    )
+
+@functools.lru_cache(maxsize=None)
+def _deserialized_fields(cls: type) -> tuple:
+    """(name, enum type, nested Serializable type) for each field from_dict accepts"""
+    # get_type_hints re-resolves every annotation, so it runs once per class
+    hints = get_type_hints(cls)
+    result = []
+    for f in fields(cls):
+        # Skip fields marked as non_serializable or starting with underscore, like to_dict
+        if f.metadata.get('non_serializable', False) or f.name.startswith('_'):
+            continue
+        field_type = hints.get(f.name)
+        if not isinstance(field_type, type):
+            field_type = None
+        result.append((
+            f.name,
+            field_type if field_type is not None and issubclass(field_type, Enum) else None,
+            field_type if field_type is not None and issubclass(field_type, Serializable) else None,
+        ))
+    return tuple(result)
+
+def serialize_value(obj: Any) -> Any:
+    """Convert a field value to plain JSON-compatible types"""
+    if isinstance(obj, Enum):
+        return obj.value
+    elif isinstance(obj, (list, tuple)):
+        return [serialize_value(item) for item in obj]
+    elif isinstance(obj, dict):
+        return {k: serialize_value(v) for k, v in obj.items()}
+    elif isinstance(obj, Serializable):
+        return obj.to_dict()
+    else:
+        return obj
+
 @dataclass
 class Serializable:
     """Base class for objects that can be serialized to and from dictionaries and JSON."""
+    # No instance dict of its own, so subclasses declared with slots=True have none either
+    __slots__ = ()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the object to a dictionary for serialization"""
-        def _serialize(obj: Any) -> Any:
-            if isinstance(obj, Enum):
-                return obj.value
-            elif isinstance(obj, list):
-                return [_serialize(item) for item in obj]
-            elif isinstance(obj, dict):
-                return {k: _serialize(v) for k, v in obj.items()}
-            elif isinstance(obj, Serializable):
-                return obj.to_dict()
-            else:
-                return obj
-
-        # Get all fields from dataclass
-        result = {}
-        for f in fields(self):
-            # Skip if field is marked as non_serializable
-            if f.metadata.get('non_serializable', False):
-                continue
-            # Skip if field starts with underscore
-            if f.name.startswith('_'):
-                continue
-            # Get the value and serialize it
-            value = getattr(self, f.name)
-            result[f.name] = _serialize(value)
-                
-        return result
+        # Field names are filtered once per class, then only values are read
+        return {
+            name: serialize_value(getattr(self, name))
+            for name in _serialized_field_names(type(self))  # type: ignore[arg-type]
+        }
 
     def to_json(self) -> str:
         """Convert the object to a JSON string"""
-        return json.dumps(self.to_dict())
+        return json_dumps(self.to_dict())
+
+    def to_msgpack(self) -> bytes:
+        """Convert the object to MessagePack bytes"""
+        return msgpack_dumps(self.to_dict())
 
     @classmethod
-    def from_dict(cls: Type[T], data: Dict[str, Any], *args, **kwargs) -> T:
+    def from_dict(cls: Type[T], data: Dict[str, Any], *args: Any, **kwargs: Any) -> T:
         """Create an instance from a dictionary"""
-        # Create a copy to avoid modifying input
-        data = data.copy()
-        
-        # Get type hints for proper type conversion
-        hints = get_type_hints(cls)
-        
-        # Convert fields based on their types
-        for field_name, field_type in hints.items():
-            if field_name in data:
-                # Skip non-serializable fields
-                field_def = cls.__dataclass_fields__[field_name]
-                if field_def.metadata.get('non_serializable', False):
-                    continue
-                    
-                # Convert enums
-                if isinstance(field_type, type) and issubclass(field_type, Enum):
-                    data[field_name] = field_type(data[field_name])
+        # Only known, serializable fields are read; unknown keys are ignored
+        filtered_data = {}
+        for name, enum_type, nested_type in _deserialized_fields(cls):  # type: ignore[arg-type]
+            if name in data:
+                value = data[name]
+                # Convert enums, unless the value already is a member
+                if enum_type is not None:
+                    if type(value) is not enum_type:
+                        value = enum_type(value)
                 # Convert nested Serializable objects
-                elif isinstance(field_type, type) and issubclass(field_type, Serializable):
-                    if isinstance(data[field_name], dict):
-                        data[field_name] = field_type.from_dict(data[field_name])
-                        
-        # Filter out non-serializable fields
-        filtered_data = {
-            k: v for k, v in data.items() 
-            if k in cls.__dataclass_fields__ and 
-            not cls.__dataclass_fields__[k].metadata.get('non_serializable', False)
-        }
+                elif nested_type is not None and isinstance(value, dict):
+                    value = nested_type.from_dict(value)
+                filtered_data[name] = value
         
-        # Combine all kwargs
-        all_kwargs = {**filtered_data, **kwargs}
+        # Combine all kwargs, explicit ones win
+        if kwargs:
+            filtered_data.update(kwargs)
         
         # Create instance with args and combined kwargs
-        return cls(*args, **all_kwargs) 
\ No newline at end of file
+        return cls(*args, **filtered_data) 
\ No newline at end of file
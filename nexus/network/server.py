@@ -1,33 +1,49 @@
 import asyncio
+import logging
 import websockets
-import json
 import uuid
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Union
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from nexus.game.gamestate import GameState, GamePhase
 from nexus.network.update import Update, UpdateType
 from nexus.network.command import Command, CommandType
 from nexus.network.player import NexusPlayer
+from nexus.network.serializable import MSGPACK_HEADER, loads_message, msgpack
 from nexus.network.game import NexusGame
 
-@dataclass
+log = logging.getLogger(__name__)
+
+def install_uvloop() -> bool:
+    """Use uvloop's faster event loop for asyncio.run if it is installed"""
+    try:
+        import uvloop  # type: ignore[import]
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+@dataclass(slots=True)
 class ConnectionManager:
     """Manages the bidirectional mapping between WebSocket connections and players"""
     socket_to_player: Dict[websockets.WebSocketServerProtocol, NexusPlayer] = field(default_factory=dict)
     player_to_socket: Dict[str, websockets.WebSocketServerProtocol] = field(default_factory=dict)
+    # Sockets whose client asked for binary MessagePack frames in the handshake
+    binary_sockets: Set[websockets.WebSocketServerProtocol] = field(default_factory=set)
 
     def add_connection(self, socket: websockets.WebSocketServerProtocol, player: NexusPlayer) -> None:
         """Add a new socket-player connection"""
-        print(f"[ConnectionManager] Adding connection for player {player.id} with game_id: {player.game_id}")
+        log.debug("Adding connection for player %s with game_id: %s", player.id, player.game_id)
         self.socket_to_player[socket] = player
         self.player_to_socket[player.id] = socket
 
     def remove_connection(self, socket: websockets.WebSocketServerProtocol) -> Optional[NexusPlayer]:
         """Remove a connection by socket and return the associated player if any"""
+        self.binary_sockets.discard(socket)
         if player := self.socket_to_player.get(socket):
-            print(f"[ConnectionManager] Removing connection for player {player.id} with game_id: {player.game_id}")
+            log.debug("Removing connection for player %s with game_id: %s", player.id, player.game_id)
             del self.socket_to_player[socket]
             del self.player_to_socket[player.id]
             return player
@@ -35,15 +51,11 @@ class ConnectionManager:
 
     def get_player(self, socket: websockets.WebSocketServerProtocol) -> Optional[NexusPlayer]:
         """Get player associated with a socket"""
-        player = self.socket_to_player.get(socket)
-        print(f"[ConnectionManager] Getting player for socket: {player.id if player else None} with game_id: {player.game_id if player else None}")
-        return player
+        return self.socket_to_player.get(socket)
 
     def get_socket(self, player_id: str) -> Optional[websockets.WebSocketServerProtocol]:
         """Get socket associated with a player ID"""
-        socket = self.player_to_socket.get(player_id)
-        print(f"[ConnectionManager] Getting socket for player: {player_id}")
-        return socket
+        return self.player_to_socket.get(player_id)
 
 class NexusServer(ABC):
     """Base server class for the Nexus framework"""
@@ -52,139 +64,141 @@ class NexusServer(ABC):
         self.port = port
         self.games: Dict[str, NexusGame] = {}
         self.connections = ConnectionManager()
-        self.matchmaking_queue: List[str] = []  # List of player IDs
-        print(f"[Server] Initialized on {host}:{port}")
-
-    async def start(self):
+        self.matchmaking_queue: Deque[str] = deque()  # Player IDs in arrival order
+        # IDs of the players still waiting; queue entries not in here are stale and skipped
+        self.matchmaking_waiting: Set[str] = set()
+        # Handlers for commands outside a game, anything else goes to _on_game_command
+        self._command_handlers = {
+            CommandType.CREATE_GAME: self._on_create_game,
+            CommandType.JOIN_GAME: self._on_join_game,
+            CommandType.FIND_GAME: self._on_find_game,
+        }
+        log.info("Initialized on %s:%s", host, port)
+
+    async def start(self) -> None:
         """Start the WebSocket server"""
-        print("[Server] Starting server...")
+        log.info("Starting server...")
         async with websockets.serve(
             self.handle_connection,
             self.host,
             self.port,
             ping_interval=10,    # Send ping every 10 seconds
-            ping_timeout=30      # Consider connection lost after 30 seconds of no response
+            ping_timeout=30,     # Consider connection lost after 30 seconds of no response
+            compression=None,    # Messages are tiny JSON, deflating them costs more than it saves
+            max_size=2**16,      # Commands are well under 1 KiB, refuse anything that would buffer 1 MiB
+            max_queue=8          # Incoming messages buffered per connection before reads pause
         ):
-            print(f"[Server] Listening on ws://{self.host}:{self.port}")
+            log.info("Listening on ws://%s:%s", self.host, self.port)
             await asyncio.Future()  # run forever
 
-    async def handle_connection(self, websocket: websockets.WebSocketServerProtocol):
+    async def handle_connection(self, websocket: websockets.WebSocketServerProtocol) -> None:
         """Handle a new WebSocket connection"""
-        print(f"[Server] New connection from {websocket.remote_address}")
-        player_id = str(uuid.uuid4())
+        log.info("New connection from %s", websocket.remote_address)
+        player_id = uuid.uuid4().hex
         player = NexusPlayer(id=player_id)
-        print(f"[Server] Created new player with id: {player_id}")
+        log.debug("Created new player with id: %s", player_id)
         self.connections.add_connection(websocket, player)
+        # Answer in MessagePack only when both sides have it
+        if msgpack is not None and websocket.request_headers.get(MSGPACK_HEADER):
+            self.connections.binary_sockets.add(websocket)
 
         try:
             async for message in websocket:
-                print(f"[Server] Received message: {message}")
+                log.debug("Received message: %s", message)
+                try:
+                    # Parse the message and build the Command directly, skipping from_dict's type hint walk
+                    data = loads_message(message)
+                    cmd = Command(CommandType(data["command_type"]), data.get("data", {}))
+                except (ValueError, KeyError, TypeError) as e:
+                    # Decode errors and unknown command types are ValueErrors
+                    log.warning("Invalid message %r: %s", message, e)
+                    await self.send_error(player, "Invalid message")
+                    continue
+                log.debug("Processing command: %s", cmd.command_type)
+                # Get the current player state from connections
+                current_player = self.connections.get_player(websocket)
+                log.debug("Current player state - id: %s, game_id: %s", current_player.id, current_player.game_id)
                 try:
-                    # Parse JSON and create Command using from_dict
-                    data = json.loads(message)
-                    cmd = Command.from_dict(data)
-                    print(f"[Server] Processing command: {cmd.command_type}")
-                    # Get the current player state from connections
-                    current_player = self.connections.get_player(websocket)
-                    print(f"[Server] Current player state - id: {current_player.id}, game_id: {current_player.game_id}")
                     await self.handle_command(current_player, cmd)
-                except json.JSONDecodeError:
-                    print(f"[Server] Error: Invalid JSON message: {message}")
-                except Exception as e:
-                    print(f"[Server] Error processing command: {str(e)}")
-                    await self.send_error(player, f"Error: {str(e)}")
+                except Exception:
+                    # The traceback stays in the server log, the client only learns the command failed
+                    log.exception("Error processing %s from %s", cmd.command_type, current_player.name)
+                    await self.send_error(current_player, "Error processing command")
         except (websockets.exceptions.ConnectionClosed, Exception) as e:
-            print(f"[Server] Connection ended: {websocket.remote_address} - {str(e)}")
+            log.info("Connection ended: %s - %s", websocket.remote_address, e)
         finally:
             # Get the current player and handle disconnect BEFORE removing the connection
             current_player = self.connections.get_player(websocket)
             if current_player:
-                print(f"[Server] Found disconnecting player: {current_player.name} with game_id: {current_player.game_id}")
+                log.debug("Found disconnecting player: %s with game_id: %s", current_player.name, current_player.game_id)
                 # Remove the connection first so other players can't send updates to this socket
                 self.connections.remove_connection(websocket)
                 # Then handle the disconnect logic
                 await self.handle_disconnect(current_player)
             else:
-                print("[Server] No player found for disconnecting websocket")
+                log.debug("No player found for disconnecting websocket")
                 self.connections.remove_connection(websocket)
 
-    async def handle_command(self, player: NexusPlayer, cmd: Command):
+    async def handle_command(self, player: NexusPlayer, cmd: Command) -> None:
         """Handle incoming commands from players"""
-        print(f"[Server] Handling command {cmd.command_type} from player {player.name}")
-        
-        if cmd.command_type == CommandType.CREATE_GAME:
-            print(f"[Server] Creating game: {cmd.data}")
-            # Create new player with updated name but preserve game_id
-            new_player = NexusPlayer(
-                id=player.id,
-                name=cmd.data.get("player_name", ""),
-                game_id=player.game_id
-            )
-            # Update our mappings
-            websocket = self.connections.get_socket(player.id)
-            self.connections.add_connection(websocket, new_player)
-            await self.create_game(new_player, cmd.data["game_name"], cmd.data.get("password"), 
-                                 cmd.data.get("max_players", 2))
-        
-        elif cmd.command_type == CommandType.JOIN_GAME:
-            print(f"[Server] Joining game: {cmd.data}")
+        log.debug("Handling command %s from player %s", cmd.command_type, player.name)
+        handler = self._command_handlers.get(cmd.command_type, self._on_game_command)
+        await handler(player, cmd)
+
+    async def _on_create_game(self, player: NexusPlayer, cmd: Command) -> None:
+        log.debug("Creating game: %s", cmd.data)
+        # The connection's player is updated in place, its mappings stay valid
+        player.name = cmd.data.get("player_name", "")
+        await self.create_game(player, cmd.data["game_name"], cmd.data.get("password"), 
+                             cmd.data.get("max_players", 2))
+
+    async def _on_join_game(self, player: NexusPlayer, cmd: Command) -> None:
+        log.debug("Joining game: %s", cmd.data)
+        player.name = cmd.data.get("player_name", "")
+        await self.join_game(player, cmd.data["game_name"], cmd.data.get("password"))
+
+    async def _on_find_game(self, player: NexusPlayer, cmd: Command) -> None:
+        log.debug("Finding game for player: %s", cmd.data)
+        player.name = cmd.data.get("player_name", "")
+        await self.find_game(player)
+
+    async def _on_game_command(self, player: NexusPlayer, cmd: Command) -> None:
+        # A player without a game has game_id None, which is never a game name
+        game = self.games.get(player.game_id)  # type: ignore[arg-type]
+        if not game:
+            log.warning("Game not found for player %s with game_id %s", player.name, player.game_id)
+            return
             
-            new_player = NexusPlayer(
-                id=player.id,
-                name=cmd.data.get("player_name", ""),
-                game_id=player.game_id
-            )
-            websocket = self.connections.get_socket(player.id)
-            self.connections.add_connection(websocket, new_player)
-            await self.join_game(new_player, cmd.data["game_name"], cmd.data.get("password"))
-        
-        elif cmd.command_type == CommandType.FIND_GAME:
-            print(f"[Server] Finding game for player: {cmd.data}")
-            new_player = NexusPlayer(
-                id=player.id,
-                name=cmd.data.get("player_name", ""),
-                game_id=player.game_id
-            )
-            websocket = self.connections.get_socket(player.id)
-            self.connections.add_connection(websocket, new_player)
-            await self.find_game(new_player)
-        
+        if cmd.command_type == CommandType.SURRENDER:
+            log.debug("Player surrendering: %s", player.name)
+            await self.handle_surrender(game, player)
         else:
-            game = self.games.get(player.game_id) if player.game_id else None
-            if not game:
-                print(f"[Server] Game not found for player {player.name} with game_id {player.game_id}")
+            if not self.validate_game_command(game, cmd):
                 return
-                
-            if cmd.command_type == CommandType.SURRENDER:
-                print(f"[Server] Player surrendering: {player.name}")
-                await self.handle_surrender(game, player)
-            else:
-                if not self.validate_game_command(game, cmd):
-                    return
-                await self.handle_game_command(game, player, cmd)
+            await self.handle_game_command(game, player, cmd)
 
     def validate_game_command(self, game: NexusGame, cmd: Command) -> bool:
         """Validate common game command conditions"""
         if game.phase != GamePhase.IN_GAME:
-            print(f"[Server] Invalid game command: game not in progress")
+            log.warning("Invalid game command: game not in progress")
             return False
 
         if cmd.command_type != CommandType.MAKE_MOVE:
-            print(f"[Server] Invalid command type: {cmd.command_type}")
+            log.warning("Invalid command type: %s", cmd.command_type)
             return False
             
         # Check if enough players are connected
         connected_players = [p for p in game.players if p.connected]
         if len(connected_players) < 2:
-            print(f"[Server] Invalid game command: not enough connected players")
+            log.warning("Invalid game command: not enough connected players")
             return False
             
         return True
 
-    async def create_game(self, player: NexusPlayer, name: str, password: Optional[str] = None, max_players: int = 2):
+    async def create_game(self, player: NexusPlayer, name: str, password: Optional[str] = None, max_players: int = 2) -> None:
         """Create a new game"""
         if name in self.games:
-            print(f"[Server] Game creation failed: {name} already exists")
+            log.warning("Game creation failed: %s already exists", name)
             await self.send_error(player, "Game name already exists")
             return
 
@@ -198,21 +212,21 @@ class NexusServer(ABC):
         )
         self.games[name] = game
         player.game_id = name
-        print(f"[Server] Game created: {name} by {player.name}")
+        log.info("Game created: %s by %s", name, player.name)
         
         update = Update(UpdateType.GAME_CREATED, {})
         await self.send_game_update(game, update, player)
 
-    async def join_game(self, player: NexusPlayer, game_name: str, password: Optional[str] = None):
+    async def join_game(self, player: NexusPlayer, game_name: str, password: Optional[str] = None) -> None:
         """Join an existing game"""
         game = self.games.get(game_name)
         if not game:
-            print(f"[Server] Join failed: Game {game_name} not found")
+            log.info("Join failed: Game %s not found", game_name)
             await self.send_error(player, "Game not found")
             return
 
         if game.password and game.password != password:
-            print(f"[Server] Join failed: Invalid password for game {game_name}")
+            log.info("Join failed: Invalid password for game %s", game_name)
             await self.send_error(player, "Invalid password")
             return
 
@@ -220,12 +234,12 @@ class NexusServer(ABC):
         existing_player = next((p for p in game.players if p.name == player.name), None)
         if existing_player:
             if existing_player.connected:
-                print(f"[Server] Join failed: Player {player.name} already in game")
+                log.info("Join failed: Player %s already in game", player.name)
                 await self.send_error(player, "Already in game")
                 return
             
             # Reconnection case - update the existing player
-            print(f"[Server] Player {player.name} reconnecting to game {game_name}")
+            log.info("Player %s reconnecting to game %s", player.name, game_name)
             existing_player.connected = True
             existing_player.last_seen = time.time()
             # Update connection mapping with the reconnected player
@@ -241,20 +255,21 @@ class NexusServer(ABC):
             update = Update(UpdateType.GAME_STATE_UPDATE, {
                 "reconnected_player": existing_player.name
             })
-            for p in game.players:
-                if p.id != existing_player.id and p.connected:
-                    await self.send_game_update(game, update, p)
+            self.broadcast_update([
+                self.connections.get_socket(p.id) for p in game.players
+                if p.id != existing_player.id and p.connected
+            ], update)
             return
 
         # Normal join case
         if len([p for p in game.players if p.connected]) >= game.max_players:
-            print(f"[Server] Join failed: Game {game_name} is full")
+            log.info("Join failed: Game %s is full", game_name)
             await self.send_error(player, "Game is full")
             return
 
-        game.players.append(player)
+        game.add_player(player)
         player.game_id = game_name
-        print(f"[Server] Player {player.name} joined game {game_name}")
+        log.info("Player %s joined game %s", player.name, game_name)
 
         # If game has enough connected players, start it
         connected_players = [p for p in game.players if p.connected]
@@ -262,32 +277,37 @@ class NexusServer(ABC):
             if not game.game_state:
                 game.game_state = self.create_initial_game_state(game.players)
             game.phase = GamePhase.IN_GAME
-            print(f"[Server] Game {game_name} starting with {len(connected_players)} players")
+            log.info("Game %s starting with %s players", game_name, len(connected_players))
 
-        # Send updates to all connected players
-        for p in game.players:
-            if p.connected:
-                state_data = self.get_player_game_state(game, p)
-                update = Update(UpdateType.GAME_STARTED, state_data)
-                await self.send_game_update(game, update, p)
+            # Send updates to all connected players
+            await self.send_game_started(game, connected_players)
+        else:
+            # Still filling up, the full state goes out once when the game starts
+            update = Update(UpdateType.GAME_STATE_UPDATE, {"joined_player": player.name})
+            self.broadcast_update([self.connections.get_socket(p.id) for p in connected_players], update)
 
-    async def find_game(self, player: NexusPlayer):
+    async def find_game(self, player: NexusPlayer) -> None:
         """Add player to matchmaking queue"""
-        print(f"[Server] Player {player.name} entered matchmaking")
-        self.matchmaking_queue.append(player.id)
+        log.info("Player %s entered matchmaking", player.name)
+        if player.id not in self.matchmaking_waiting:
+            self.matchmaking_waiting.add(player.id)
+            self.matchmaking_queue.append(player.id)
         
-        if len(self.matchmaking_queue) >= 2:
-            print(f"[Server] Found enough players for a match")
+        if len(self.matchmaking_waiting) >= 2:
+            log.debug("Found enough players for a match")
             players = []
-            for pid in self.matchmaking_queue[:2]:
+            for _ in range(2):
+                pid = self.matchmaking_queue.popleft()
+                while pid not in self.matchmaking_waiting:
+                    pid = self.matchmaking_queue.popleft()
+                self.matchmaking_waiting.remove(pid)
                 socket = self.connections.get_socket(pid)
                 player = self.connections.get_player(socket)
-                print(f"[Server] Retrieved player from connections: {player.name} (id: {player.id})")
+                log.debug("Retrieved player from connections: %s (id: %s)", player.name, player.id)
                 players.append(player)
-            self.matchmaking_queue = self.matchmaking_queue[2:]
             
             game_name = f"match_{len(self.games)}"
-            print(f"[Server] Creating matchmaking game {game_name}")
+            log.info("Creating matchmaking game %s", game_name)
             
             game = NexusGame(
                 name=game_name,
@@ -301,31 +321,31 @@ class NexusServer(ABC):
             
             # Update all players with their game_id
             for p in players:
-                # Create new player instance with game_id
-                updated_player = NexusPlayer(
-                    id=p.id,
-                    name=p.name,
-                    game_id=game_name
-                )
-                print(f"[Server] Created updated player: {updated_player.name} (id: {updated_player.id}, game_id: {updated_player.game_id})")
-                
-                # Update the connection mapping
-                socket = self.connections.get_socket(p.id)
-                self.connections.add_connection(socket, updated_player)
-                print(f"[Server] Updated connection mapping for player")
-                
-                # Send game state
-                state_data = self.get_player_game_state(game, updated_player)
-                update = Update(UpdateType.GAME_STARTED, state_data)
-                await self.send_game_update(game, update, updated_player)
-
-    async def handle_surrender(self, game: NexusGame, player: NexusPlayer):
+                p.game_id = game_name
+
+            # Send game state
+            await self.send_game_started(game, players)
+
+    async def send_game_started(self, game: NexusGame, players: List[NexusPlayer]) -> None:
+        """Send each player the game state from their perspective"""
+        if game.game_state is not None and game.game_state.is_perspective_invariant():
+            # Everyone sees the same state, so build and serialize it once
+            update = Update(UpdateType.GAME_STARTED, self.get_player_game_state(game, players[0]))
+            self.broadcast_update([self.connections.get_socket(p.id) for p in players], update)
+            return
+        # Concurrently, so one slow connection doesn't hold up the others
+        await asyncio.gather(*(
+            self.send_game_update(game, Update(UpdateType.GAME_STARTED, self.get_player_game_state(game, p)), p)
+            for p in players
+        ))
+
+    async def handle_surrender(self, game: NexusGame, player: NexusPlayer) -> None:
         """Handle a player surrendering"""
         if not player.game_id:
             return
             
         game.phase = GamePhase.END_GAME
-        print(f"[Server] Player {player.name} surrendered in game {game.name}")
+        log.info("Player %s surrendered in game %s", player.name, game.name)
         
         # Determine winners (everyone except the surrendering player)
         winners = [p.name for p in game.players if p != player]
@@ -338,17 +358,18 @@ class NexusServer(ABC):
         
         await self.end_game(game)
 
-    async def handle_disconnect(self, player: NexusPlayer):
+    async def handle_disconnect(self, player: NexusPlayer) -> None:
         """Handle a player disconnecting"""
-        print(f"[Server] Player {player.name} disconnected")
+        log.info("Player %s disconnected", player.name)
         
         # Update player status
         player.connected = False
         player.last_seen = time.time()
         
-        if player.id in self.matchmaking_queue:
-            self.matchmaking_queue.remove(player.id)
-            print(f"[Server] Removed {player.name} from matchmaking queue")
+        if player.id in self.matchmaking_waiting:
+            # Its queue entry is skipped when it reaches the front
+            self.matchmaking_waiting.remove(player.id)
+            log.debug("Removed %s from matchmaking queue", player.name)
             
         if player.game_id:
             game = self.games[player.game_id]
@@ -360,9 +381,9 @@ class NexusServer(ABC):
                 if p.id != player.id and p.connected:
                     await self.send_game_update(game, update, p)
             
-    async def end_game(self, game: NexusGame):
+    async def end_game(self, game: NexusGame) -> None:
         """Clean up a finished game"""
-        print(f"[Server] Ending game {game.name}")
+        log.info("Ending game %s", game.name)
         for player in game.players:
             player.game_id = None
         if game.name in self.games:
@@ -370,22 +391,22 @@ class NexusServer(ABC):
 
     def get_player_game_state(self, game: NexusGame, player: NexusPlayer) -> dict:
         """Get the game state from a specific player's perspective"""
-        player_index = game.players.index(player)
+        player_index = game.player_index(player)
         return game.game_state.get_player_perspective(player_index)
 
-    async def handle_game_command(self, game: NexusGame, player: NexusPlayer, cmd: Command):
+    async def handle_game_command(self, game: NexusGame, player: NexusPlayer, cmd: Command) -> None:
         """Handle game-specific commands"""
-        print(f"[Server] Handling game command from {player.name} in game {game.name}")
+        log.debug("Handling game command from %s in game %s", player.name, game.name)
         # Get player index and validate command
-        player_index = game.players.index(player)
+        player_index = game.player_index(player)
         is_valid, error_message = game.game_state.is_valid(cmd, player_index)
         if not is_valid:
-            print(f"[Server] Invalid command from {player.name}: {error_message}")
+            log.warning("Invalid command from %s: %s", player.name, error_message)
             await self.send_error(player, error_message)
             return
 
         # Create and apply the update
-        update = Update(UpdateType.GAME_STATE_UPDATE, cmd.data)
+        update = Update(UpdateType.GAME_STATE_UPDATE, game.game_state.get_update_data(cmd))
         game.game_state.apply(update)
         await self.send_game_update(game, update)
         
@@ -394,7 +415,7 @@ class NexusServer(ABC):
             game.phase = GamePhase.END_GAME
             
             if game.game_state.winner:
-                print(f"[Server] Game ended: {game.game_state.winner} wins!")
+                log.info("Game ended: %s wins!", game.game_state.winner)
                 # Then send game over update
                 game_over_update = Update(UpdateType.GAME_OVER, {
                     "winner": game.game_state.winner,
@@ -402,7 +423,7 @@ class NexusServer(ABC):
                 })
                 await self.send_game_update(game, game_over_update)
             else:
-                print(f"[Server] Game ended: Draw!")
+                log.info("Game ended: Draw!")
                 # Send game over update
                 game_over_update = Update(UpdateType.GAME_OVER, {
                     "winner": None,
@@ -414,31 +435,51 @@ class NexusServer(ABC):
             #print(f"[Server] Broadcasting updated game state to all players")
             #await self.send_game_update(game, update)
 
-    async def send_game_update(self, game: NexusGame, update: Update, specific_player: NexusPlayer|None=None):
+    async def send_game_update(self, game: NexusGame, update: Update, specific_player: NexusPlayer|None=None) -> None:
+        """Send a game update to one player, or to all players in a game"""
         if specific_player:
-            """Send a game update to all players in a game"""
-            print(f"[Server] Sending update to {specific_player.name}")
+            log.debug("Sending update to %s", specific_player.name)
             # Always send the full state from player's perspective
             #player_index = game.players.index(specific_player)
             #state_data = self.get_player_game_state(game, specific_player)
             #player_update = Update(update.update_type, state_data)
             #message = player_update.to_json()
-            message = update.to_json()
-            print(f"[Server] Update message: {message}")
-            websocket = self.connections.get_socket(specific_player.id)
-            await websocket.send(message)
+            await self.send_update(specific_player, update)
         else:
-            """Send a game update to all players in a game"""
-            print(f"[Server] Broadcasting update to all players")
-            for p in game.players:
-                await self.send_game_update(game, update, p)
+            log.debug("Broadcasting update to all players")
+            self.broadcast_update([self.connections.get_socket(p.id) for p in game.players], update)
+
+    def broadcast_update(self, sockets: Iterable[Optional[websockets.WebSocketServerProtocol]], update: Update) -> None:
+        """Send an update to many sockets, serialized once per wire format"""
+        # Queue the same frame on every connection in one go, without a
+        # write/drain round trip per player
+        binary = self.connections.binary_sockets
+        text_sockets: List[websockets.WebSocketServerProtocol] = []
+        binary_sockets: List[websockets.WebSocketServerProtocol] = []
+        for socket in sockets:
+            if socket is not None:
+                (binary_sockets if socket in binary else text_sockets).append(socket)
+        if text_sockets:
+            websockets.broadcast(text_sockets, update.to_json())
+        if binary_sockets:
+            websockets.broadcast(binary_sockets, update.to_msgpack())
+
+    async def send_update(self, player: NexusPlayer, update: Update) -> None:
+        """Send an update to a player in the wire format their client uses"""
+        websocket = self.connections.get_socket(player.id)
+        message: Union[str, bytes]
+        if websocket in self.connections.binary_sockets:
+            message = update.to_msgpack()
+        else:
+            message = update.to_json()
+        log.debug("Update message: %s", message)
+        await websocket.send(message)
 
-    async def send_error(self, player: NexusPlayer, error_message: str):
+    async def send_error(self, player: NexusPlayer, error_message: str) -> None:
         """Send an error message to a player"""
-        print(f"[Server] Sending error to {player.name}: {error_message}")
+        log.debug("Sending error to %s: %s", player.name, error_message)
         update = Update(UpdateType.ERROR, {"message": error_message})
-        websocket = self.connections.get_socket(player.id)
-        await websocket.send(update.to_json())
+        await self.send_update(player, update)
 
     @abstractmethod
     def create_initial_game_state(self, players: List[NexusPlayer]) -> GameState:
@@ -447,6 +488,7 @@ class NexusServer(ABC):
 
 if __name__ == "__main__":
     server = NexusServer()
+    install_uvloop()
     asyncio.run(server.start())
 
     
\ No newline at end of file
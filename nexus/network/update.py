@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any
 from enum import Enum
-from nexus.network.serializable import Serializable
+from nexus.network.serializable import Serializable, serialize_value
 
 
 class UpdateType(str, Enum):
@@ -11,8 +11,11 @@ class UpdateType(str, Enum):
     GAME_STATE_UPDATE = "game_state_update"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True)
 class Update(Serializable):
     update_type: UpdateType
     data: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Every outgoing message is an Update, so build its dict directly"""
+        return {"update_type": serialize_value(self.update_type), "data": serialize_value(self.data)}